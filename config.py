@@ -5,12 +5,43 @@ from pathlib import Path
 basedir = Path(__file__).parent
 
 
+def engine_options(database_uri):
+    """Connection pool settings for server databases (PostgreSQL, MySQL).
+
+    SQLite keeps SQLAlchemy's defaults: file databases get a small QueuePool
+    and in-memory ones a StaticPool, which rejects pool sizing arguments.
+    """
+    if database_uri.startswith('sqlite'):
+        return {}
+    return {
+        'pool_size': int(os.environ.get('PORTFOLIO_DB_POOL_SIZE', '10')),
+        'max_overflow': int(os.environ.get('PORTFOLIO_DB_MAX_OVERFLOW', '20')),
+        'pool_timeout': 30,
+        # Recycle before typical server-side idle timeouts drop the socket.
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
+
+
 class Config:
     """Base configuration"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f'sqlite:///{basedir / "portfolio.db"}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # SQLALCHEMY_ENGINE_OPTIONS is left unset so create_app() can derive it
+    # from the final database URI (see engine_options()); a config class may
+    # still set it explicitly. Size the pool to roughly 2x the worker threads
+    # hitting the database, and keep pool_size + max_overflow per process
+    # below the server's max_connections.
+
+    # Run db.create_all() + schema migrations inside create_app(). Set to 0 on
+    # workers whose schema is already managed so they skip reflection at boot.
+    RUN_MIGRATIONS_ON_STARTUP = os.environ.get('PORTFOLIO_RUN_MIGRATIONS', '1') in ('1', 'true', 'True')
+
+    # Directory for Jinja's compiled-template bytecode cache. When set, restarted
+    # workers load templates from disk instead of recompiling them on first hit.
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('PORTFOLIO_JINJA_CACHE_DIR') or None
 
     # Security hardening
     WTF_CSRF_ENABLED = True
@@ -44,3 +75,4 @@ class Config:
 
     # Transaction types
     TRANSACTION_TYPES = ['Buy', 'Sell']
+    TRANSACTION_TYPES_SET = frozenset(TRANSACTION_TYPES)
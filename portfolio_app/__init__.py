@@ -1,44 +1,172 @@
+import os
+
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf.csrf import CSRFProtect, CSRFError
 from flask_login import LoginManager
-from config import Config
+from jinja2 import FileSystemBytecodeCache
+from config import Config, engine_options
 from portfolio_app.utils import fmt_decimal, fmt_money
 
 db = SQLAlchemy()
 csrf = CSRFProtect()
 login_manager = LoginManager()
 
+# Database URIs whose schema create_app() has already created and migrated in
+# this process. Later create_app() calls against the same database skip it.
+_initialized_dbs = set()
+
+
+def _get_column_names(conn, table: str) -> set:
+    """Return the column names of a table without full type reflection."""
+    import sqlalchemy as sa
+    dialect = conn.dialect.name
+    try:
+        if dialect == 'sqlite':
+            rows = conn.execute(sa.text(f'PRAGMA table_info("{table}")')).fetchall()
+            return {row[1] for row in rows}
+        if dialect == 'postgresql':
+            rows = conn.execute(
+                sa.text(
+                    'SELECT column_name FROM information_schema.columns '
+                    'WHERE table_schema = current_schema() AND table_name = :table'
+                ),
+                {'table': table},
+            ).fetchall()
+            return {row[0] for row in rows}
+    except sa.exc.DBAPIError:
+        conn.rollback()
+    return {c['name'] for c in sa.inspect(conn).get_columns(table)}
+
 
 def _run_migrations(app):
     """Apply incremental schema changes that SQLAlchemy create_all() cannot handle."""
     import sqlalchemy as sa
     with app.app_context():
         with db.engine.connect() as conn:
-            inspector = sa.inspect(db.engine)
-
-            capital_cols = {c['name'] for c in inspector.get_columns('capital')}
+            capital_cols = _get_column_names(conn, 'capital')
+            capital_alters = []
 
             # 1. Add user_id column if missing
             if 'user_id' not in capital_cols:
-                conn.execute(sa.text(
-                    'ALTER TABLE capital ADD COLUMN user_id INTEGER REFERENCES "user"(id)'
-                ))
-                conn.commit()
-                capital_cols.add('user_id')
+                capital_alters.append('ADD COLUMN user_id INTEGER REFERENCES "user"(id)')
 
             # 2. Rename amount_usd → amount if still using the old name
             if 'amount_usd' in capital_cols and 'amount' not in capital_cols:
-                conn.execute(sa.text(
-                    'ALTER TABLE capital RENAME COLUMN amount_usd TO amount'
-                ))
+                capital_alters.append('RENAME COLUMN amount_usd TO amount')
+
+            # Neither SQLite nor PostgreSQL accepts RENAME alongside other
+            # actions in one ALTER TABLE, so the statements run separately
+            # but share a single transaction and commit.
+            if capital_alters:
+                for clause in capital_alters:
+                    conn.execute(sa.text(f'ALTER TABLE capital {clause}'))
                 conn.commit()
 
-
-def create_app(config_class=Config):
-    """Application factory pattern."""
+            # 3. Create indexes added to models after their table already existed
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+            conn.commit()
+
+            # 4. SQLite caches amounts as text (see FundSummaryCache). The
+            #    cache only holds derived data, so a table from before that
+            #    change is recreated empty and refilled by step 6.
+            if conn.dialect.name == 'sqlite':
+                from portfolio_app.models import FundSummaryCache
+                rows = conn.execute(sa.text('PRAGMA table_info("fund_summary_cache")')).fetchall()
+                column_types = {row[1]: row[2].upper() for row in rows}
+                if column_types.get('total_buy_cost', '').startswith('NUMERIC'):
+                    FundSummaryCache.__table__.drop(bind=conn)
+                    FundSummaryCache.__table__.create(bind=conn)
+                    conn.commit()
+
+        # 5. Normalize symbols (strip + upper) on rows written before the
+        #    models did so on write. A legacy asset whose normalized symbol
+        #    is already tracked by its fund is a duplicate and is dropped.
+        from portfolio_app.models import Asset, Transaction
+        from portfolio_app.calculators.summary_cache import (
+            rebuild_fund_summaries,
+            rebuild_stale_summaries,
+        )
+        tx_table, asset_table = Transaction.__table__, Asset.__table__
+        tx_unnormalized = tx_table.c.symbol != sa.func.upper(sa.func.trim(tx_table.c.symbol))
+        touched_funds = db.session.execute(
+            sa.select(tx_table.c.capital_id).where(tx_unnormalized).distinct()
+        ).scalars().all()
+        if touched_funds:
+            db.session.execute(
+                sa.update(tx_table).where(tx_unnormalized)
+                .values(symbol=sa.func.upper(sa.func.trim(tx_table.c.symbol)))
+            )
+
+        other = asset_table.alias('other')
+        asset_key = sa.func.upper(sa.func.trim(asset_table.c.symbol))
+        db.session.execute(
+            sa.delete(asset_table).where(
+                sa.exists().where(
+                    other.c.capital_id == asset_table.c.capital_id,
+                    sa.func.upper(sa.func.trim(other.c.symbol)) == asset_key,
+                    other.c.id < asset_table.c.id,
+                )
+            )
+        )
+        db.session.execute(
+            sa.update(asset_table).where(asset_table.c.symbol != asset_key).values(symbol=asset_key)
+        )
+        db.session.commit()
+
+        # 6. Backfill the per-symbol summary cache for databases that predate
+        #    it, and rebuild funds whose symbols step 5 rewrote
+        rebuild_fund_summaries(db.session, touched_funds)
+        rebuild_stale_summaries(db.session)
+        db.session.commit()
+
+        # 7. Give legacy funds that have a balance but no event history an
+        #    Initial event, in one INSERT ... SELECT. Funds with amount=0 are
+        #    skipped: their owner may have deleted every event on purpose.
+        from portfolio_app.models import Fund, FundEvent
+        from portfolio_app.utils.constants import EventType
+        missing = (
+            sa.select(
+                Fund.id,
+                sa.literal(EventType.INITIAL),
+                Fund.amount,
+                Fund.created_at,
+            )
+            .where(Fund.amount != 0)
+            .where(~sa.exists().where(FundEvent.fund_id == Fund.id))
+        )
+        db.session.execute(
+            sa.insert(FundEvent).from_select(
+                [FundEvent.fund_id, FundEvent.event_type, FundEvent.amount_delta, FundEvent.date],
+                missing,
+            )
+        )
+        db.session.commit()
+
+
+def _is_memory_database(uri: str) -> bool:
+    """In-memory SQLite starts empty for every engine, so it is never cached."""
+    return uri.startswith('sqlite') and (uri.rstrip('/') == 'sqlite:' or ':memory:' in uri)
+
+
+def create_app(config_class=Config, force=False):
+    """Application factory pattern.
+
+    Args:
+        config_class: Configuration object to load
+        force: Run table creation and migrations even if this process has
+            already done so for the configured database
+    """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    # Pool options follow the URI actually in use, so a subclass that swaps
+    # in SQLite never inherits the server pool settings from DATABASE_URL.
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS',
+        engine_options(app.config['SQLALCHEMY_DATABASE_URI']),
+    )
 
     # Initialize extensions
     db.init_app(app)
@@ -52,7 +180,7 @@ def create_app(config_class=Config):
     @login_manager.user_loader
     def load_user(user_id: str):
         from portfolio_app.models.user import User
-        return User.query.get(int(user_id))
+        return db.session.get(User, int(user_id))
 
     @app.errorhandler(CSRFError)
     def _handle_csrf_error(e: CSRFError):
@@ -72,6 +200,11 @@ def create_app(config_class=Config):
             return redirect(ref)
         return redirect(url_for("dashboard.index"))
 
+    cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
     # Template filters
     app.jinja_env.filters['fmt_decimal'] = fmt_decimal
     app.jinja_env.filters['fmt_money'] = fmt_money
@@ -84,12 +217,16 @@ def create_app(config_class=Config):
             'category_icon_default': app.config.get('ASSET_CATEGORY_ICON_DEFAULT', ('bi-folder', 'text-secondary')),
         }
 
-    # Create tables and run migrations
-    with app.app_context():
-        # Import all models so SQLAlchemy knows about them before create_all()
-        from portfolio_app.models import User, Fund, Transaction, Asset, FundEvent  # noqa: F401
-        db.create_all()
-        _run_migrations(app)
+    # Create tables and run migrations (skippable when the schema is managed elsewhere)
+    db_key = app.config['SQLALCHEMY_DATABASE_URI']
+    if app.config.get('RUN_MIGRATIONS_ON_STARTUP', True) and (force or db_key not in _initialized_dbs):
+        with app.app_context():
+            # Import all models so SQLAlchemy knows about them before create_all()
+            from portfolio_app.models import User, Fund, Transaction, Asset, FundEvent, FundSummaryCache  # noqa: F401
+            db.create_all()
+            _run_migrations(app)
+        if not _is_memory_database(db_key):
+            _initialized_dbs.add(db_key)
 
     # Register blueprints
     from portfolio_app.routes import register_blueprints
@@ -2,5 +2,6 @@
 
 from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator
 from portfolio_app.calculators.transaction_manager import TransactionManager
+from portfolio_app.calculators import summary_cache  # noqa: F401  (registers session listeners)
 
 __all__ = ['PortfolioCalculator', 'TransactionManager']
@@ -1,10 +1,51 @@
 """Portfolio calculator for financial calculations."""
 
 from decimal import Decimal
-from sqlalchemy import case, func
-from portfolio_app.models import Fund, Transaction, FundEvent
+from functools import lru_cache
+from flask import g, has_request_context
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm.attributes import set_committed_value
+from portfolio_app import db
+from portfolio_app.models import Fund, Transaction, FundEvent, FundSummaryCache
 
 ZERO = Decimal('0')
+HUNDRED = Decimal('100')
+
+# Per-symbol summary fields summed into fund-level dashboard totals.
+_FUND_TOTAL_KEYS = (
+    'total_buy_cost',
+    'total_sell_cost',
+    'current_invested',
+    'realized_pnl',
+    'realized_cost_basis',
+)
+
+# Rows fetched per round trip by the single-pass scans below; keeps the
+# driver buffer bounded on funds with long histories.
+SCAN_BATCH_SIZE = 500
+
+# Columns the average-cost walk reads. Read-only scans select just these so
+# they stream light Row tuples instead of hydrating Transaction entities.
+_SUMMARY_COLUMNS = (
+    Transaction.fund_id,
+    Transaction.symbol,
+    Transaction.transaction_type,
+    Transaction.price,
+    Transaction.quantity,
+    Transaction.fees,
+)
+
+# Smallest step of the Numeric(20, 10) cost columns; stored costs closer than
+# this to a recomputed value are left as they are.
+_COST_COLUMN_UNIT = Decimal('1E-10')
+
+# ORDER BY for the average-cost walk: trade day, buys before sells on the
+# same day, then id. Built once and shared by every ordered scan.
+TRANSACTION_PROCESSING_ORDER = (
+    func.date(Transaction.date).asc(),
+    case((Transaction.transaction_type == 'Buy', 0), else_=1),
+    Transaction.id.asc(),
+)
 
 
 def _safe_divide(numerator, denominator, default=ZERO):
@@ -13,10 +54,45 @@ def _safe_divide(numerator, denominator, default=ZERO):
 
 
 def _to_decimal(value) -> Decimal:
-    """Convert any numeric value to Decimal safely."""
+    """Convert any numeric value to Decimal safely.
+
+    Decimals (what Numeric columns return) pass through untouched and None
+    (a NULL column or empty aggregate) becomes ZERO; ints convert exactly;
+    anything else goes through str() to avoid float artifacts.
+    """
+    if type(value) is Decimal:
+        return value
+    if value is None:
+        return ZERO
+    if isinstance(value, (Decimal, int)):
+        return Decimal(value)
     return Decimal(str(value))
 
 
+@lru_cache(maxsize=4096)
+def _normalize_symbol_str(symbol: str) -> str:
+    """Cached strip/upper — symbol cardinality is tiny, lookups are hot."""
+    return symbol.strip().upper()
+
+
+def _funds_by_id(user_id=None) -> dict:
+    """Return {fund_id: Fund} for a user (all funds when user_id is None).
+
+    Within a request the mapping is cached on ``flask.g``, so the dashboard's
+    several aggregates share one SELECT. Outside a request it is always fresh.
+    """
+    q = Fund.query
+    if user_id is not None:
+        q = q.filter_by(user_id=user_id)
+    if not has_request_context():
+        return {f.id: f for f in q.all()}
+
+    cache = g.setdefault('_funds_by_user', {})
+    if user_id not in cache:
+        cache[user_id] = {f.id: f for f in q.all()}
+    return cache[user_id]
+
+
 def _roi_display(pnl: Decimal, base: Decimal) -> tuple:
     """Compute ROI percentage and display string.
 
@@ -25,7 +101,7 @@ def _roi_display(pnl: Decimal, base: Decimal) -> tuple:
     """
     if base == 0:
         return ZERO, '—'
-    roi = (pnl / abs(base)) * 100
+    roi = (pnl / abs(base)) * HUNDRED
     return roi, f"{roi:+,.2f}%"
 
 
@@ -34,11 +110,27 @@ class PortfolioCalculator:
 
     _to_decimal = staticmethod(_to_decimal)
 
+    @staticmethod
+    def invalidate_fund_cache():
+        """Drop the request-scoped fund caches after funds or their rows change."""
+        if has_request_context():
+            g.pop('_funds_by_user', None)
+            g.pop('_fund_data_by_user', None)
+
+    @staticmethod
+    def get_funds(user_id=None) -> list:
+        """Return a user's funds (all funds when user_id is None).
+
+        Backed by the request-scoped fund cache, so repositories and
+        calculators share one SELECT per request.
+        """
+        return list(_funds_by_id(user_id).values())
+
     @staticmethod
     def normalize_symbol(symbol) -> str:
         if symbol is None:
             return ''
-        return str(symbol).strip().upper()
+        return _normalize_symbol_str(str(symbol))
 
     # ------------------------------------------------------------------
     # Quantity helpers
@@ -47,40 +139,40 @@ class PortfolioCalculator:
     @staticmethod
     def get_quantity_held_for_fund(fund_id, exclude_transaction_id=None):
         """Return current quantity held for a fund."""
-        query = Transaction.query.filter_by(fund_id=fund_id)
-        if exclude_transaction_id is not None:
-            query = query.filter(Transaction.id != exclude_transaction_id)
-        transactions = query.order_by(Transaction.date.asc()).all()
-
-        running_quantity = ZERO
-        for t in transactions:
-            qty = _to_decimal(t.quantity)
-            if t.transaction_type == 'Buy':
-                running_quantity += qty
-            elif t.transaction_type == 'Sell':
-                running_quantity -= qty
-
-        return running_quantity
+        return PortfolioCalculator._sum_quantity_held(
+            Transaction.fund_id == fund_id,
+            exclude_transaction_id=exclude_transaction_id,
+        )
 
     @staticmethod
     def get_quantity_held_for_symbol(fund_id, symbol, exclude_transaction_id=None):
         """Return current quantity held for a specific symbol inside a fund."""
         normalized = PortfolioCalculator.normalize_symbol(symbol)
+        return PortfolioCalculator._sum_quantity_held(
+            Transaction.fund_id == fund_id,
+            Transaction.symbol == normalized,
+            exclude_transaction_id=exclude_transaction_id,
+        )
+
+    @staticmethod
+    def _sum_quantity_held(*criteria, exclude_transaction_id=None) -> Decimal:
+        """Net bought-minus-sold quantity of the matching rows.
 
-        query = Transaction.query.filter_by(fund_id=fund_id, symbol=normalized)
+        Only the type and quantity columns are read, and they are summed in
+        Decimal so sell validation agrees with the average-cost walk (SQL
+        SUM() would be float arithmetic on SQLite).
+        """
+        query = db.session.query(Transaction.transaction_type, Transaction.quantity).filter(*criteria)
         if exclude_transaction_id is not None:
             query = query.filter(Transaction.id != exclude_transaction_id)
-        transactions = query.order_by(Transaction.date.asc()).all()
-
-        running_quantity = ZERO
-        for t in transactions:
-            qty = _to_decimal(t.quantity)
-            if t.transaction_type == 'Buy':
-                running_quantity += qty
-            elif t.transaction_type == 'Sell':
-                running_quantity -= qty
 
-        return running_quantity
+        held = ZERO
+        for transaction_type, quantity in query.yield_per(SCAN_BATCH_SIZE):
+            if transaction_type == 'Buy':
+                held += _to_decimal(quantity)
+            elif transaction_type == 'Sell':
+                held -= _to_decimal(quantity)
+        return held
 
     # ------------------------------------------------------------------
     # Portfolio-level aggregates
@@ -89,18 +181,28 @@ class PortfolioCalculator:
     @staticmethod
     def get_total_portfolio_value(user_id=None):
         """Total portfolio value (invested + cash across all categories)."""
-        q = Fund.query
-        if user_id is not None:
-            q = q.filter_by(user_id=user_id)
-        funds = q.all()
         total = ZERO
-        for f in funds:
-            cash = PortfolioCalculator.get_cash_balance_for_fund(f.id)
-            tx_summary = PortfolioCalculator.get_category_transactions_summary(f.id)
-            invested = _to_decimal(tx_summary['current_invested'] or 0)
-            total += invested + cash
+        for fund_data in PortfolioCalculator._fetch_all_fund_data(user_id):
+            metrics = PortfolioCalculator._summarize_fund_data(*fund_data)
+            total += metrics['current_invested'] + metrics['cash']
         return total
 
+    @staticmethod
+    def get_fund_metrics(user_id=None):
+        """Per-fund total funds, cash, invested and realized figures for all funds.
+
+        Same numbers as calling get_total_funds_for_fund(),
+        get_cash_balance_for_fund() and get_category_transactions_summary()
+        per fund, but loaded with a fixed number of queries.
+
+        Returns:
+            Dict of fund ID -> metrics dict (see _summarize_fund_data())
+        """
+        return {
+            fund_data[0].id: PortfolioCalculator._summarize_fund_data(*fund_data)
+            for fund_data in PortfolioCalculator._fetch_all_fund_data(user_id)
+        }
+
     @staticmethod
     def get_total_funds_for_fund(fund_id) -> Decimal:
         """Total Funds = sum of Initial + Deposit events only.
@@ -112,47 +214,57 @@ class PortfolioCalculator:
         Fallback: legacy funds with no event history return fund.amount
         directly so that old databases display correctly without migration.
         """
-        rows = (
-            FundEvent.query
-            .with_entities(FundEvent.amount_delta)
+        event_count, total = (
+            db.session.query(func.count(FundEvent.id), func.sum(FundEvent.amount_delta))
             .filter(
                 FundEvent.fund_id == fund_id,
                 FundEvent.event_type.in_(['Initial', 'Deposit']),
             )
-            .all()
+            .one()
         )
-        if rows:
-            return sum((_to_decimal(r.amount_delta) for r in rows), ZERO)
+        if event_count:
+            return _to_decimal(total)
 
         # No event history — legacy fund. Use fund.amount as best approximation.
-        fund = Fund.query.get(fund_id)
-        return _to_decimal(fund.amount or 0) if fund else ZERO
+        fund = db.session.get(Fund, fund_id)
+        return _to_decimal(fund.amount) if fund else ZERO
 
     @staticmethod
     def get_cash_balance_for_fund(fund_id, exclude_transaction_id=None) -> Decimal:
-        """Compute cash balance: fund_amount - buy_outflows + sell_inflows."""
-        fund = Fund.query.get(fund_id)
-        if not fund:
-            return ZERO
+        """Compute cash balance: fund_amount - buy_outflows + sell_inflows.
 
-        cash = _to_decimal(fund.amount or 0)
-        query = Transaction.query.filter_by(fund_id=fund_id)
+        fund.amount and the fund's transaction columns come back from one
+        query (fund LEFT JOIN transactions); the cash flows are summed in
+        Decimal, like the average-cost walk, since SQL SUM() over
+        price * quantity is float arithmetic on SQLite.
+        """
+        join_on = Transaction.fund_id == Fund.id
         if exclude_transaction_id is not None:
-            query = query.filter(Transaction.id != exclude_transaction_id)
-        transactions = query.order_by(Transaction.date.asc()).all()
+            join_on = and_(join_on, Transaction.id != exclude_transaction_id)
 
-        for t in transactions:
-            price = _to_decimal(t.price)
-            quantity = _to_decimal(t.quantity)
-            fees = _to_decimal(t.fees)
-            gross = price * quantity
+        rows = (
+            db.session.query(
+                Fund.amount,
+                Transaction.transaction_type,
+                Transaction.price,
+                Transaction.quantity,
+                Transaction.fees,
+            )
+            .outerjoin(Transaction, join_on)
+            .filter(Fund.id == fund_id)
+            .yield_per(SCAN_BATCH_SIZE)
+        )
 
-            if t.transaction_type == 'Buy':
-                cash -= gross + fees
-            elif t.transaction_type == 'Sell':
-                cash += gross - fees
+        cash = None
+        for amount, transaction_type, price, quantity, fees in rows:
+            if cash is None:
+                cash = _to_decimal(amount)
+            if transaction_type == 'Buy':
+                cash -= _to_decimal(price) * _to_decimal(quantity) + _to_decimal(fees)
+            elif transaction_type == 'Sell':
+                cash += _to_decimal(price) * _to_decimal(quantity) - _to_decimal(fees)
 
-        return cash
+        return ZERO if cash is None else cash
 
     # ------------------------------------------------------------------
     # Category summary (dashboard cards)
@@ -164,27 +276,20 @@ class PortfolioCalculator:
 
         Manual-entry based: funds = cash balance, only REALIZED profit shown.
         """
-        q = Fund.query
-        if user_id is not None:
-            q = q.filter_by(user_id=user_id)
-        funds = q.all()
-
-        # First pass: compute per-category values
-        categories = []
+        summary = []
         portfolio_value = ZERO
-        for fund in funds:
+        for fund_data in PortfolioCalculator._fetch_all_fund_data(user_id):
+            fund = fund_data[0]
+            metrics = PortfolioCalculator._summarize_fund_data(*fund_data)
+
             # Total Funds = deposits only (withdrawals excluded), consistent
             # with the Funds page display. fund.amount (net) is only used
-            # internally by get_cash_balance_for_fund for cash calculation.
-            total_funds = PortfolioCalculator.get_total_funds_for_fund(fund.id)
-
-            realized_perf = PortfolioCalculator.get_realized_performance_for_fund(fund.id)
-            realized_pnl = realized_perf['realized_pnl']
-
-            transactions_summary = PortfolioCalculator.get_category_transactions_summary(fund.id)
-            current_invested = _to_decimal(transactions_summary['current_invested'] or 0)
+            # internally for the cash calculation.
+            total_funds = metrics['total_funds']
+            realized_pnl = metrics['realized_pnl']
+            current_invested = metrics['current_invested']
+            cash = metrics['cash']
 
-            cash = PortfolioCalculator.get_cash_balance_for_fund(fund.id)
             # category_value is the true current worth: what's invested + liquid cash.
             # This is used as total_value so both metrics are consistent.
             category_value = current_invested + cash
@@ -192,37 +297,24 @@ class PortfolioCalculator:
 
             # ROI: prefer total_funds as base; fallback to realized_cost_basis
             # when fund events are deleted (total_funds=0 but trades exist).
-            roi_base = total_funds if total_funds != 0 else realized_perf['realized_cost_basis']
+            roi_base = total_funds if total_funds != 0 else metrics['realized_cost_basis']
             realized_roi_percent, realized_roi_display = _roi_display(realized_pnl, roi_base)
 
-            categories.append({
-                'fund': fund,
-                'total_funds': total_funds,
+            summary.append({
+                'category': fund.category,
+                'amount': total_funds,
+                'id': fund.id,
                 'realized_pnl': realized_pnl,
                 'current_invested': current_invested,
+                'total_value': category_value,
                 'cash': cash,
-                'category_value': category_value,
                 'realized_roi_percent': realized_roi_percent,
                 'realized_roi_display': realized_roi_display,
             })
 
-        # Second pass: compute allocation based on portfolio value
-        summary = []
-        for cat in categories:
-            allocation = (cat['category_value'] / abs(portfolio_value) * 100) if portfolio_value != 0 else ZERO
-
-            summary.append({
-                'category': cat['fund'].category,
-                'amount': cat['total_funds'],
-                'allocation': Decimal(str(allocation)),
-                'id': cat['fund'].id,
-                'realized_pnl': cat['realized_pnl'],
-                'current_invested': cat['current_invested'],
-                'total_value': cat['category_value'],
-                'cash': cat['cash'],
-                'realized_roi_percent': cat['realized_roi_percent'],
-                'realized_roi_display': cat['realized_roi_display'],
-            })
+        # Allocation needs the final portfolio value, so it is filled in last
+        for cat in summary:
+            cat['allocation'] = (cat['total_value'] / abs(portfolio_value) * HUNDRED) if portfolio_value != 0 else ZERO
 
         return summary, portfolio_value
 
@@ -233,43 +325,20 @@ class PortfolioCalculator:
     @staticmethod
     def get_realized_pnl_for_fund(fund_id):
         """Sum realized P&L across all symbols for a fund."""
-        symbols = (
-            Transaction.query.with_entities(Transaction.symbol)
-            .filter_by(fund_id=fund_id)
-            .distinct()
-            .all()
-        )
-        realized = ZERO
-        for (sym,) in symbols:
-            sym_norm = PortfolioCalculator.normalize_symbol(sym)
-            if not sym_norm:
-                continue
-            s = PortfolioCalculator.get_symbol_transactions_summary(fund_id, sym_norm)
-            realized += _to_decimal(s['realized_pnl'])
-        return realized
+        return PortfolioCalculator.get_realized_performance_for_fund(fund_id)['realized_pnl']
 
     @staticmethod
     def get_realized_performance_for_fund(fund_id):
         """Return realized P&L, cost basis, and proceeds for a fund."""
-        symbols = (
-            Transaction.query.with_entities(Transaction.symbol)
-            .filter_by(fund_id=fund_id)
-            .distinct()
-            .all()
-        )
-
         realized_pnl = ZERO
         realized_cost_basis = ZERO
         realized_proceeds = ZERO
 
-        for (sym,) in symbols:
-            sym_norm = PortfolioCalculator.normalize_symbol(sym)
-            if not sym_norm:
-                continue
-            s = PortfolioCalculator.get_symbol_transactions_summary(fund_id, sym_norm)
-            realized_pnl += _to_decimal(s['realized_pnl'])
-            realized_cost_basis += _to_decimal(s['realized_cost_basis'])
-            realized_proceeds += _to_decimal(s['realized_proceeds'])
+        for transactions in PortfolioCalculator._summary_rows_by_fund([fund_id]).get(fund_id, {}).values():
+            s = PortfolioCalculator.get_symbol_transactions_summary_from_list(transactions)
+            realized_pnl += s['realized_pnl']
+            realized_cost_basis += s['realized_cost_basis']
+            realized_proceeds += s['realized_proceeds']
 
         return {
             'realized_pnl': realized_pnl,
@@ -284,29 +353,21 @@ class PortfolioCalculator:
     @staticmethod
     def get_portfolio_dashboard_totals(user_id=None):
         """Dashboard totals: investment, cash, ROI."""
-        q = Fund.query
-        if user_id is not None:
-            q = q.filter_by(user_id=user_id)
-        funds = q.all()
-
         total_investment = ZERO
         total_cash = ZERO
         total_invested = ZERO
         total_realized_pnl = ZERO
         total_realized_cost_basis = ZERO
 
-        for fund in funds:
-            # Use deposits-only total, consistent with get_category_summary()
-            total_investment += PortfolioCalculator.get_total_funds_for_fund(fund.id)
-
-            total_cash += PortfolioCalculator.get_cash_balance_for_fund(fund.id)
+        for fund_data in PortfolioCalculator._fetch_all_fund_data(user_id):
+            metrics = PortfolioCalculator._summarize_fund_data(*fund_data)
 
-            tx_summary = PortfolioCalculator.get_category_transactions_summary(fund.id)
-            total_invested += _to_decimal(tx_summary['current_invested'] or 0)
-
-            realized_perf = PortfolioCalculator.get_realized_performance_for_fund(fund.id)
-            total_realized_pnl += realized_perf['realized_pnl']
-            total_realized_cost_basis += realized_perf['realized_cost_basis']
+            # Use deposits-only total, consistent with get_category_summary()
+            total_investment += metrics['total_funds']
+            total_cash += metrics['cash']
+            total_invested += metrics['current_invested']
+            total_realized_pnl += metrics['realized_pnl']
+            total_realized_cost_basis += metrics['realized_cost_basis']
 
         total_value = total_invested + total_cash
 
@@ -324,6 +385,163 @@ class PortfolioCalculator:
             'realized_roi_display': realized_roi_display,
         }
 
+    @staticmethod
+    def _fetch_all_fund_data(user_id=None):
+        """Load every fund with its deposits and transaction totals.
+
+        Within a request the result is cached on ``flask.g`` so the dashboard's
+        summary and totals share one load; any flush drops it (see
+        invalidate_fund_cache()). Outside a request it is always fresh.
+        """
+        if not has_request_context():
+            return PortfolioCalculator._load_all_fund_data(user_id)
+
+        cache = g.setdefault('_fund_data_by_user', {})
+        if user_id not in cache:
+            cache[user_id] = PortfolioCalculator._load_all_fund_data(user_id)
+        return cache[user_id]
+
+    @staticmethod
+    def _load_all_fund_data(user_id=None):
+        """Query every fund with its deposits and transaction totals.
+
+        Transaction totals are added up from the FundSummaryCache rows. A
+        fund whose cached transaction count or highest transaction id
+        disagrees with the transaction table (e.g. a database created before
+        the cache existed) is recomputed from its rows instead.
+
+        Returns:
+            List of (fund, deposit_deltas, tx_totals) tuples, where
+            deposit_deltas is None for legacy funds without Initial/Deposit events.
+        """
+        funds = list(_funds_by_id(user_id).values())
+        if not funds:
+            return []
+
+        fund_ids = [f.id for f in funds]
+
+        deposits = {}
+        event_rows = (
+            db.session.query(FundEvent.fund_id, FundEvent.amount_delta)
+            .filter(
+                FundEvent.fund_id.in_(fund_ids),
+                FundEvent.event_type.in_(['Initial', 'Deposit']),
+            )
+            .all()
+        )
+        for row in event_rows:
+            deposits.setdefault(row.fund_id, []).append(row.amount_delta)
+
+        # Per-symbol cache rows are added up here in Decimal; a SQL SUM()
+        # would be float arithmetic on SQLite and drift from the walk.
+        tx_totals = {}
+        cached_stats = {}
+        cache_rows = (
+            db.session.query(
+                FundSummaryCache.fund_id,
+                FundSummaryCache.transaction_count,
+                FundSummaryCache.last_tx_id,
+                *(getattr(FundSummaryCache, key) for key in _FUND_TOTAL_KEYS),
+            )
+            .filter(FundSummaryCache.fund_id.in_(fund_ids))
+            .all()
+        )
+        for row in cache_rows:
+            totals = tx_totals.get(row.fund_id)
+            if totals is None:
+                totals = tx_totals[row.fund_id] = {key: ZERO for key in _FUND_TOTAL_KEYS}
+            for key in _FUND_TOTAL_KEYS:
+                totals[key] += _to_decimal(getattr(row, key))
+            count, last_id = cached_stats.get(row.fund_id, (0, 0))
+            cached_stats[row.fund_id] = (count + row.transaction_count, max(last_id, row.last_tx_id or 0))
+
+        tx_stats = {
+            row.fund_id: (row.count, row.last_id or 0)
+            for row in (
+                db.session.query(
+                    Transaction.fund_id,
+                    func.count(Transaction.id).label('count'),
+                    func.max(Transaction.id).label('last_id'),
+                )
+                .filter(Transaction.fund_id.in_(fund_ids))
+                .group_by(Transaction.fund_id)
+            )
+        }
+        stale = [
+            fid for fid in fund_ids
+            if tx_stats.get(fid, (0, 0)) != cached_stats.get(fid, (0, 0))
+        ]
+
+        result = dict(tx_totals)
+        result.update(PortfolioCalculator._compute_fund_totals(stale))
+
+        return [(f, deposits.get(f.id), result.get(f.id)) for f in funds]
+
+    @staticmethod
+    def _compute_fund_totals(fund_ids):
+        """Recompute fund-level transaction totals from the transaction rows."""
+        if not fund_ids:
+            return {}
+
+        by_fund = PortfolioCalculator._summary_rows_by_fund(fund_ids)
+        totals = {}
+        for fund_id in fund_ids:
+            fund_totals = {key: ZERO for key in _FUND_TOTAL_KEYS}
+            for transactions in by_fund.get(fund_id, {}).values():
+                s = PortfolioCalculator.get_symbol_transactions_summary_from_list(transactions)
+                for key in _FUND_TOTAL_KEYS:
+                    fund_totals[key] += s[key]
+            totals[fund_id] = fund_totals
+        return totals
+
+    @staticmethod
+    def _summary_rows_by_fund(fund_ids):
+        """Stream the summary columns of some funds, grouped by fund then symbol.
+
+        Args:
+            fund_ids: Funds to scan
+
+        Returns:
+            Dict of fund ID -> {normalized symbol: rows in processing order}
+        """
+        by_fund = {}
+        rows = (
+            db.session.query(*_SUMMARY_COLUMNS)
+            .filter(Transaction.fund_id.in_(fund_ids))
+            .order_by(*TRANSACTION_PROCESSING_ORDER)
+        )
+        normalize = PortfolioCalculator.normalize_symbol
+        for row in rows.yield_per(SCAN_BATCH_SIZE):
+            sym_norm = normalize(row.symbol)
+            if not sym_norm:
+                continue
+            by_fund.setdefault(row.fund_id, {}).setdefault(sym_norm, []).append(row)
+        return by_fund
+
+    @staticmethod
+    def _summarize_fund_data(fund, deposit_deltas, tx_totals):
+        """Compute per-fund dashboard metrics from pre-loaded data.
+
+        Mirrors get_total_funds_for_fund(), get_cash_balance_for_fund(),
+        get_category_transactions_summary() and get_realized_performance_for_fund()
+        without touching the database.
+        """
+        if deposit_deltas is not None:
+            total_funds = sum((_to_decimal(d) for d in deposit_deltas), ZERO)
+        else:
+            total_funds = _to_decimal(fund.amount)
+
+        tx_totals = tx_totals or {key: ZERO for key in _FUND_TOTAL_KEYS}
+        cash = _to_decimal(fund.amount) + tx_totals['total_sell_cost'] - tx_totals['total_buy_cost']
+
+        return {
+            'total_funds': total_funds,
+            'cash': cash,
+            'current_invested': tx_totals['current_invested'],
+            'realized_pnl': tx_totals['realized_pnl'],
+            'realized_cost_basis': tx_totals['realized_cost_basis'],
+        }
+
     # ------------------------------------------------------------------
     # Transaction summaries
     # ------------------------------------------------------------------
@@ -331,13 +549,6 @@ class PortfolioCalculator:
     @staticmethod
     def get_category_transactions_summary(fund_id):
         """Get aggregated transaction summary for a category."""
-        symbols = (
-            Transaction.query.with_entities(Transaction.symbol)
-            .filter_by(fund_id=fund_id)
-            .distinct()
-            .all()
-        )
-
         totals = {
             'total_buy_cost': ZERO,
             'total_buy_fees': ZERO,
@@ -351,42 +562,86 @@ class PortfolioCalculator:
             'transaction_count': 0,
         }
 
-        for (sym,) in symbols:
-            sym_norm = PortfolioCalculator.normalize_symbol(sym)
-            if not sym_norm:
-                continue
-            summary = PortfolioCalculator.get_symbol_transactions_summary(fund_id, sym_norm)
+        # Every symbol goes through the Decimal walk; summing price * quantity
+        # in SQL would be float arithmetic on SQLite and drift from it.
+        for transactions in PortfolioCalculator._summary_rows_by_fund([fund_id]).get(fund_id, {}).values():
+            summary = PortfolioCalculator.get_symbol_transactions_summary_from_list(transactions)
             for key in totals:
-                if key == 'transaction_count':
-                    totals[key] += int(summary[key])
-                else:
-                    totals[key] += _to_decimal(summary[key])
+                totals[key] += summary[key]
 
-        # Weighted average cost across symbols (approximate)
+        # Weighted average cost across symbols (approximate). Each symbol's
+        # average_cost * quantity_held is its current_invested, so the summed
+        # total already holds the weighted cost.
         avg_cost = ZERO
         if totals['total_quantity_held'] > 0:
-            weighted_cost = ZERO
-            for (sym,) in symbols:
-                sym_norm = PortfolioCalculator.normalize_symbol(sym)
-                if not sym_norm:
-                    continue
-                s = PortfolioCalculator.get_symbol_transactions_summary(fund_id, sym_norm)
-                weighted_cost += _to_decimal(s['average_cost']) * _to_decimal(s['total_quantity_held'])
-            avg_cost = weighted_cost / totals['total_quantity_held']
+            avg_cost = totals['current_invested'] / totals['total_quantity_held']
 
         return {**totals, 'average_cost': avg_cost}
 
+    @staticmethod
+    def get_fund_transactions_by_symbol(fund_id):
+        """Load every transaction of a fund in one query, grouped by symbol.
+
+        Returns:
+            Dict of normalized symbol -> transactions, each list in the
+            chronological order expected by get_symbol_transactions_summary_from_list().
+        """
+        return PortfolioCalculator.get_transactions_by_fund_and_symbol([fund_id]).get(fund_id, {})
+
+    @staticmethod
+    def get_transactions_by_fund_and_symbol(fund_ids):
+        """Load the transactions of several funds in one query.
+
+        Grouping keeps the processing order of the single scan, so every
+        list is ordered as get_fund_transactions_by_symbol() returns it.
+
+        Returns:
+            Dict of fund ID -> normalized symbol -> transactions (funds
+            without transactions are absent)
+        """
+        fund_ids = list(fund_ids)
+        if not fund_ids:
+            return {}
+
+        transactions = (
+            Transaction.query
+            .filter(Transaction.fund_id.in_(fund_ids))
+            .order_by(*TRANSACTION_PROCESSING_ORDER)
+            .yield_per(SCAN_BATCH_SIZE)
+        )
+
+        by_fund = {}
+        normalize = PortfolioCalculator.normalize_symbol
+        for t in transactions:
+            sym_norm = normalize(t.symbol)
+            if not sym_norm:
+                continue
+            by_fund.setdefault(t.fund_id, {}).setdefault(sym_norm, []).append(t)
+        return by_fund
+
+    @staticmethod
+    def _ordered_transactions(fund_id, symbol=None):
+        """Query a fund's transactions (optionally one symbol) in processing order.
+
+        Order is by trade day, buys before sells on the same day, then id —
+        the order the average-cost walk depends on.
+        """
+        query = Transaction.query.filter_by(fund_id=fund_id)
+        if symbol is not None:
+            query = query.filter_by(symbol=symbol)
+        return query.order_by(*TRANSACTION_PROCESSING_ORDER)
+
     @staticmethod
     def get_symbol_transactions_summary(fund_id, symbol):
         """Get aggregated transaction summary for a specific symbol."""
         symbol = PortfolioCalculator.normalize_symbol(symbol)
-        buy_first = case((Transaction.transaction_type == 'Buy', 0), else_=1)
-        transactions = (
-            Transaction.query.filter_by(fund_id=fund_id, symbol=symbol)
-            .order_by(func.date(Transaction.date).asc(), buy_first, Transaction.id.asc())
+        rows = (
+            db.session.query(*_SUMMARY_COLUMNS)
+            .filter(Transaction.fund_id == fund_id, Transaction.symbol == symbol)
+            .order_by(*TRANSACTION_PROCESSING_ORDER)
             .all()
         )
-        return PortfolioCalculator.get_symbol_transactions_summary_from_list(transactions)
+        return PortfolioCalculator.get_symbol_transactions_summary_from_list(rows)
 
     @staticmethod
     def get_symbol_transactions_summary_from_list(transactions):
@@ -409,12 +664,19 @@ class PortfolioCalculator:
         running_cost = ZERO
 
         for t in transactions:
-            price = _to_decimal(t.price)
-            quantity = _to_decimal(t.quantity)
-            fees = _to_decimal(t.fees)
+            # Numeric columns already yield Decimal; skip the helper call for
+            # them since this loop runs once per transaction row.
+            price, quantity, fees = t.price, t.quantity, t.fees
+            if type(price) is not Decimal:
+                price = _to_decimal(price)
+            if type(quantity) is not Decimal:
+                quantity = _to_decimal(quantity)
+            if type(fees) is not Decimal:
+                fees = _to_decimal(fees)
+            gross = price * quantity
 
             if t.transaction_type == 'Buy':
-                cost = (price * quantity) + fees
+                cost = gross + fees
                 total_buy_cost += cost
                 total_buy_fees += fees
                 total_buy_quantity += quantity
@@ -422,20 +684,21 @@ class PortfolioCalculator:
                 running_quantity += quantity
 
             elif t.transaction_type == 'Sell':
-                proceeds = (price * quantity) - fees
+                proceeds = gross - fees
                 total_sell_cost += proceeds
                 total_sell_fees += fees
                 total_sell_quantity += quantity
                 realized_proceeds += proceeds
 
                 # P&L = (sell_price - avg_cost) * qty - fees
-                avg_cost = _safe_divide(running_cost, running_quantity)
-                realized_pnl += (price - avg_cost) * quantity - fees
-                realized_cost_basis += avg_cost * quantity
+                # (computed as proceeds - cost basis, which is the same thing)
+                cost_basis = _safe_divide(running_cost, running_quantity) * quantity
+                realized_pnl += proceeds - cost_basis
+                realized_cost_basis += cost_basis
 
                 # Reduce position at average-cost basis
                 running_quantity -= quantity
-                running_cost -= avg_cost * quantity
+                running_cost -= cost_basis
 
         return {
             'total_buy_cost': total_buy_cost,
@@ -460,19 +723,10 @@ class PortfolioCalculator:
     @staticmethod
     def recalculate_all_averages_for_fund(fund_id):
         """Recalculate average costs for all transactions of a fund."""
-        symbols = (
-            Transaction.query.with_entities(Transaction.symbol)
-            .filter_by(fund_id=fund_id)
-            .distinct()
-            .all()
-        )
-
         updated = []
-        for (sym,) in symbols:
-            sym_norm = PortfolioCalculator.normalize_symbol(sym)
-            if not sym_norm:
-                continue
-            updated.extend(PortfolioCalculator.recalculate_all_averages_for_symbol(fund_id, sym_norm))
+        for transactions in PortfolioCalculator.get_fund_transactions_by_symbol(fund_id).values():
+            PortfolioCalculator._apply_running_averages(transactions)
+            updated.extend(transactions)
 
         return updated
 
@@ -480,29 +734,61 @@ class PortfolioCalculator:
     def recalculate_all_averages_for_symbol(fund_id, symbol):
         """Recalculate average costs for all transactions of a (fund, symbol) pair."""
         symbol = PortfolioCalculator.normalize_symbol(symbol)
-        buy_first = case((Transaction.transaction_type == 'Buy', 0), else_=1)
-        transactions = (
-            Transaction.query.filter_by(fund_id=fund_id, symbol=symbol)
-            .order_by(func.date(Transaction.date).asc(), buy_first, Transaction.id.asc())
-            .all()
-        )
+        transactions = PortfolioCalculator._ordered_transactions(fund_id, symbol).all()
 
+        PortfolioCalculator._apply_running_averages(transactions)
+        return transactions
+
+    @staticmethod
+    def _apply_running_averages(transactions):
+        """Walk a pre-sorted (single-symbol) list and persist each row's costs.
+
+        Rows are written with one bulk UPDATE instead of a unit-of-work UPDATE
+        per dirty object. The in-memory instances receive the same values via
+        set_committed_value(), so callers still see them without a refresh.
+        Rows whose stored costs already match are skipped, so appending the
+        newest trade only rewrites that row.
+        """
         running_quantity = ZERO
         running_cost = ZERO
+        updates = []
 
         for transaction in transactions:
-            transaction.calculate_total_cost()
+            price = _to_decimal(transaction.price)
+            quantity = _to_decimal(transaction.quantity)
+            fees = _to_decimal(transaction.fees)
+            gross = price * quantity
 
             if transaction.transaction_type == 'Buy':
-                cost = (_to_decimal(transaction.price) * _to_decimal(transaction.quantity)) + _to_decimal(transaction.fees)
-                running_cost += cost
-                running_quantity += _to_decimal(transaction.quantity)
-                transaction.average_cost = _safe_divide(running_cost, running_quantity)
+                total_cost = gross + fees
+                running_cost += total_cost
+                running_quantity += quantity
+                average_cost = _safe_divide(running_cost, running_quantity)
 
             elif transaction.transaction_type == 'Sell':
-                sell_qty = _to_decimal(transaction.quantity)
-                transaction.average_cost = _safe_divide(running_cost, running_quantity)
-                running_quantity -= sell_qty
-                running_cost -= transaction.average_cost * sell_qty
+                total_cost = gross - fees
+                average_cost = _safe_divide(running_cost, running_quantity)
+                running_quantity -= quantity
+                running_cost -= average_cost * quantity
 
-        return transactions
+            else:
+                continue
+
+            if transaction.id is None:
+                # Not flushed yet: let the unit of work insert it as usual.
+                transaction.total_cost = total_cost
+                transaction.average_cost = average_cost
+                continue
+
+            if (
+                abs(_to_decimal(transaction.total_cost) - total_cost) < _COST_COLUMN_UNIT
+                and abs(_to_decimal(transaction.average_cost) - average_cost) < _COST_COLUMN_UNIT
+            ):
+                continue
+
+            updates.append({'id': transaction.id, 'total_cost': total_cost, 'average_cost': average_cost})
+            set_committed_value(transaction, 'total_cost', total_cost)
+            set_committed_value(transaction, 'average_cost', average_cost)
+
+        if updates:
+            db.session.bulk_update_mappings(Transaction, updates)
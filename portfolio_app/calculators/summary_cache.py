@@ -0,0 +1,258 @@
+"""Maintenance of the FundSummaryCache table.
+
+Transaction writes mark their (fund, symbol) pair dirty while the session
+flushes; right after the flush each dirty pair is recomputed with the regular
+average-cost walk and its cache row upserted, inside the same database
+transaction. Rebuilds lock the fund row first, so two writers to one fund
+recompute one after the other and the later one sees the earlier's rows;
+the upsert keeps them off the (fund, symbol) unique key either way.
+Deleting a fund drops its cache rows before the fund row itself, so
+databases that enforce foreign keys accept the delete.
+"""
+
+from itertools import chain
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+from portfolio_app.models import Fund, Transaction
+from portfolio_app.models.fund_summary_cache import FundSummaryCache
+from portfolio_app.calculators.portfolio_calculator import (
+    PortfolioCalculator,
+    TRANSACTION_PROCESSING_ORDER,
+)
+
+# Transaction attributes that feed the summary; edits to anything else
+# (notes, average_cost, ...) leave the cache valid.
+_SUMMARY_INPUTS = ('fund_id', 'symbol', 'transaction_type', 'price', 'quantity', 'fees', 'date')
+
+_PENDING_KEY = 'fund_summary_cache_pending'
+
+# Dialects with INSERT ... ON CONFLICT (fund_id, symbol) DO UPDATE.
+_ON_CONFLICT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def _summary_rows_query(fund_ids, symbols=None):
+    """Column rows for the given funds in average-cost processing order."""
+    query = (
+        select(
+            Transaction.fund_id,
+            Transaction.id,
+            Transaction.symbol,
+            Transaction.transaction_type,
+            Transaction.price,
+            Transaction.quantity,
+            Transaction.fees,
+        )
+        .where(Transaction.fund_id.in_(fund_ids))
+        .order_by(*TRANSACTION_PROCESSING_ORDER)
+    )
+    if symbols is not None:
+        query = query.where(Transaction.symbol.in_({sym for _, sym in symbols}))
+    return query
+
+
+def _cache_values(fund_id, symbol, transactions):
+    """Build one cache row from a pre-sorted single-symbol list."""
+    s = PortfolioCalculator.get_symbol_transactions_summary_from_list(transactions)
+    return {
+        'fund_id': fund_id,
+        'symbol': symbol,
+        'transaction_count': s['transaction_count'],
+        'last_tx_id': max(t.id for t in transactions),
+        'total_buy_cost': s['total_buy_cost'],
+        'total_sell_cost': s['total_sell_cost'],
+        'total_quantity_held': s['total_quantity_held'],
+        'current_invested': s['current_invested'],
+        'realized_pnl': s['realized_pnl'],
+        'realized_cost_basis': s['realized_cost_basis'],
+        'realized_proceeds': s['realized_proceeds'],
+    }
+
+
+def rebuild_fund_summaries(session, fund_ids, symbols=None):
+    """Recompute cache rows for some funds (optionally only some symbols).
+
+    Args:
+        session: SQLAlchemy session to execute on
+        fund_ids: Funds to rebuild
+        symbols: Optional set of (fund_id, normalized symbol) pairs to limit
+            the rebuild to; every symbol of the funds when omitted
+    """
+    fund_ids = list(fund_ids)
+    if not fund_ids:
+        return
+
+    # SQLite already runs one writer at a time; elsewhere a concurrent
+    # rebuild of the same fund waits here until this transaction commits.
+    if session.get_bind().dialect.name != 'sqlite':
+        session.execute(
+            select(Fund.id).where(Fund.id.in_(fund_ids)).with_for_update(key_share=True)
+        )
+
+    grouped = {}
+    normalize = PortfolioCalculator.normalize_symbol
+    for row in session.execute(_summary_rows_query(fund_ids, symbols)):
+        sym_norm = normalize(row.symbol)
+        if not sym_norm or (symbols is not None and (row.fund_id, sym_norm) not in symbols):
+            continue
+        grouped.setdefault((row.fund_id, sym_norm), []).append(row)
+
+    # Pairs without transactions left lose their row; the rest are upserted.
+    for fund_id in fund_ids:
+        kept = {sym for fid, sym in grouped if fid == fund_id}
+        if symbols is None:
+            criteria = [FundSummaryCache.fund_id == fund_id]
+            if kept:
+                criteria.append(FundSummaryCache.symbol.notin_(kept))
+            _delete_cache_rows(session, criteria)
+        else:
+            gone = {sym for fid, sym in symbols if fid == fund_id} - kept
+            if gone:
+                _delete_cache_rows(session, [
+                    FundSummaryCache.fund_id == fund_id,
+                    FundSummaryCache.symbol.in_(gone),
+                ])
+
+    values = [_cache_values(fund_id, sym, rows) for (fund_id, sym), rows in grouped.items()]
+    if values:
+        _upsert_cache_rows(session, values)
+
+
+def rebuild_stale_summaries(session):
+    """Rebuild every fund whose cache disagrees with its transaction rows.
+
+    A fund is stale when its cached transaction count or highest
+    transaction id differs from the transaction table.
+
+    Returns:
+        List of rebuilt fund IDs
+    """
+    tx_stats = {
+        row.fund_id: (row.count, row.last_id or 0)
+        for row in session.execute(
+            select(
+                Transaction.fund_id,
+                func.count(Transaction.id).label('count'),
+                func.max(Transaction.id).label('last_id'),
+            ).group_by(Transaction.fund_id)
+        )
+    }
+    cached_stats = {
+        row.fund_id: (row.count or 0, row.last_id or 0)
+        for row in session.execute(
+            select(
+                FundSummaryCache.fund_id,
+                func.sum(FundSummaryCache.transaction_count).label('count'),
+                func.max(FundSummaryCache.last_tx_id).label('last_id'),
+            ).group_by(FundSummaryCache.fund_id)
+        )
+    }
+
+    stale = [
+        fund_id for fund_id in set(tx_stats) | set(cached_stats)
+        if tx_stats.get(fund_id, (0, 0)) != cached_stats.get(fund_id, (0, 0))
+    ]
+    rebuild_fund_summaries(session, stale)
+    return stale
+
+
+def _upsert_cache_rows(session, values):
+    """Insert cache rows, updating the row already stored for a (fund, symbol) pair."""
+    table = FundSummaryCache.__table__
+    key_columns = (table.c.capital_id, table.c.symbol)
+    update_names = [c.name for c in table.columns if c.name not in ('id', 'capital_id', 'symbol')]
+    dialect = session.get_bind().dialect.name
+
+    if dialect in _ON_CONFLICT_INSERTS:
+        stmt = _ON_CONFLICT_INSERTS[dialect](FundSummaryCache)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={name: stmt.excluded[name] for name in update_names},
+        )
+        session.execute(stmt, values)
+    elif dialect in ('mysql', 'mariadb'):
+        stmt = mysql.insert(FundSummaryCache)
+        stmt = stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_names})
+        session.execute(stmt, values)
+    else:
+        # No native upsert: update in place, insert only pairs with no row.
+        for row in values:
+            changes = {k: v for k, v in row.items() if k not in ('fund_id', 'symbol')}
+            updated = session.execute(
+                update(FundSummaryCache)
+                .where(
+                    FundSummaryCache.fund_id == row['fund_id'],
+                    FundSummaryCache.symbol == row['symbol'],
+                )
+                .values(**changes)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not updated:
+                session.execute(insert(FundSummaryCache), [row])
+
+
+def _delete_cache_rows(session, criteria):
+    session.execute(
+        delete(FundSummaryCache)
+        .where(*criteria)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _input_changed(obj) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[key].history.has_changes() for key in _SUMMARY_INPUTS)
+
+
+@event.listens_for(Session, 'before_flush')
+def _delete_rows_of_deleted_funds(session, flush_context, instances):
+    """Drop cache rows of funds about to be deleted, ahead of DELETE FROM capital."""
+    fund_ids = [obj.id for obj in session.deleted if isinstance(obj, Fund) and obj.id is not None]
+    if fund_ids:
+        _delete_cache_rows(session, [FundSummaryCache.fund_id.in_(fund_ids)])
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_dirty_pairs(session, flush_context):
+    """Record which (fund, symbol) pairs the flush touched."""
+    pending = session.info.setdefault(_PENDING_KEY, {'pairs': set(), 'deleted_funds': set()})
+
+    for obj in session.deleted:
+        if isinstance(obj, Fund):
+            pending['deleted_funds'].add(obj.id)
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Transaction):
+            continue
+        if obj in session.dirty and not _input_changed(obj):
+            continue
+        pending['pairs'].add((obj.fund_id, PortfolioCalculator.normalize_symbol(obj.symbol)))
+        if obj in session.dirty:
+            state = inspect(obj)
+            old_funds = state.attrs.fund_id.history.deleted or [obj.fund_id]
+            old_symbols = state.attrs.symbol.history.deleted or [obj.symbol]
+            for fund_id in old_funds:
+                for symbol in old_symbols:
+                    pending['pairs'].add((fund_id, PortfolioCalculator.normalize_symbol(symbol)))
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_request_caches(session, flush_context):
+    """Written rows make the request-scoped fund data stale."""
+    PortfolioCalculator.invalidate_fund_cache()
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _rebuild_dirty_pairs(session, flush_context):
+    """Replace cache rows of every pair collected during the flush."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+
+    deleted_funds = pending['deleted_funds']
+    pairs = {(fid, sym) for fid, sym in pending['pairs'] if fid not in deleted_funds and sym}
+    if pairs:
+        rebuild_fund_summaries(session, {fid for fid, _ in pairs}, symbols=pairs)
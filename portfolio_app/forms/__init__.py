@@ -3,6 +3,7 @@
 from portfolio_app.forms.base_form import BaseForm
 from portfolio_app.forms.validators import (
     parse_decimal_field,
+    parse_date_ymd,
     validate_positive_decimal,
     get_field_error_message,
 )
@@ -23,6 +24,7 @@ from portfolio_app.forms.transaction_forms import (
 __all__ = [
     'BaseForm',
     'parse_decimal_field',
+    'parse_date_ymd',
     'validate_positive_decimal',
     'get_field_error_message',
     'FundAddForm',
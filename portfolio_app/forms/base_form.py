@@ -1,8 +1,10 @@
 """Base form class for common validation functionality."""
 
+from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import AbstractSet, Dict, Any, Optional
 from portfolio_app.forms.validators import (
+    parse_date_ymd,
     validate_positive_decimal,
     get_field_error_message,
 )
@@ -43,7 +45,28 @@ class BaseForm:
         Returns:
             True if there are errors, False otherwise
         """
-        return len(self.errors) > 0
+        return bool(self.errors)
+
+    def _stripped(self, field_name: str) -> str:
+        """Return a field's raw value stripped of whitespace ('' when missing)."""
+        return (self.data.get(field_name) or '').strip()
+
+    def _int_field(self, field_name: str) -> Optional[int]:
+        """Parse an integer field ('' -> 0, unparseable -> None).
+
+        Plain digit strings skip the exception path; anything else (signs,
+        underscores, ...) goes through int() so it is accepted or rejected
+        exactly as before.
+        """
+        value = self._stripped(field_name)
+        if not value:
+            return 0
+        if value.isdecimal():
+            return int(value)
+        try:
+            return int(value)
+        except ValueError:
+            return None
 
     def _validate_decimal(
         self,
@@ -62,7 +85,7 @@ class BaseForm:
         Returns:
             Decimal value if valid, None otherwise (error added to self.errors)
         """
-        value_str = (self.data.get(field_name) or '').strip()
+        value_str = self._stripped(field_name)
         dec, err = validate_positive_decimal(value_str, allow_zero=allow_zero, allow_blank=allow_blank)
 
         if err:
@@ -88,7 +111,7 @@ class BaseForm:
         Returns:
             String value if valid, None otherwise (error added to self.errors)
         """
-        value = (self.data.get(field_name) or '').strip()
+        value = self._stripped(field_name)
         if not value:
             self.errors[field_name] = error_msg
             return None
@@ -97,25 +120,61 @@ class BaseForm:
     def _validate_choice(
         self,
         field_name: str,
-        choices: list,
+        choices: AbstractSet[str],
         error_msg: str = 'Invalid choice.'
     ) -> Optional[str]:
         """Validate a choice field.
 
         Args:
             field_name: Name of the field in form data
-            choices: List of valid choices
+            choices: Set of valid choices
             error_msg: Error message if validation fails
 
         Returns:
             Choice value if valid, None otherwise (error added to self.errors)
         """
-        value = (self.data.get(field_name) or '').strip()
+        value = self._stripped(field_name)
         if value not in choices:
             self.errors[field_name] = error_msg
             return None
         return value
 
+    def _validate_date(self, field_name: str, *, required: bool = True) -> Optional[datetime]:
+        """Validate a YYYY-MM-DD date field.
+
+        Args:
+            field_name: Name of the field in form data
+            required: Whether a blank value is an error
+
+        Returns:
+            Parsed datetime if valid, None otherwise (error added to self.errors)
+        """
+        date_str = self._get_string(field_name, default='')
+        if not date_str:
+            if required:
+                self.errors[field_name] = 'Required.'
+            return None
+        try:
+            return parse_date_ymd(date_str)
+        except ValueError:
+            self.errors[field_name] = 'Invalid date format. Use YYYY-MM-DD.'
+            return None
+
+    def _validate_amount_delta_and_notes(self, amount_key: str, notes_key: str) -> bool:
+        """Validate a positive amount plus optional notes for fund events.
+
+        Stores ``amount_delta`` and ``notes`` in cleaned_data.
+
+        Returns:
+            True if the amount is valid, False otherwise
+        """
+        self.cleaned_data['notes'] = self._get_string(notes_key, default='')
+        amount_delta = self._validate_decimal(amount_key, allow_zero=False)
+        if amount_delta is None:
+            return False
+        self.cleaned_data['amount_delta'] = amount_delta
+        return True
+
     def _get_string(self, field_name: str, default: Optional[str] = '') -> Optional[str]:
         """Get string value from form data.
 
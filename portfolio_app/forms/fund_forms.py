@@ -16,6 +16,7 @@ class FundAddForm(BaseForm):
         """
         super().__init__(data)
         self.available_categories = available_categories
+        self._available_set = frozenset(available_categories)
 
     def validate(self) -> bool:
         """Validate fund add form.
@@ -25,7 +26,7 @@ class FundAddForm(BaseForm):
         """
         # Validate category
         category = self._validate_required_string('category', 'Select a category.')
-        if category and category not in self.available_categories:
+        if category and category not in self._available_set:
             self.errors['category'] = f'{category} already exists.'
         elif category:
             self.cleaned_data['category'] = category
@@ -36,15 +37,9 @@ class FundAddForm(BaseForm):
             self.cleaned_data['amount'] = amount
 
         # Validate date (required)
-        date_str = self._get_string('add_fund_date', default='')
-        if not date_str:
-            self.errors['add_fund_date'] = 'Required.'
-        else:
-            from datetime import datetime
-            try:
-                self.cleaned_data['date'] = datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                self.errors['add_fund_date'] = 'Invalid date format. Use YYYY-MM-DD.'
+        date = self._validate_date('add_fund_date')
+        if date is not None:
+            self.cleaned_data['date'] = date
 
         return not self.has_errors()
 
@@ -68,25 +63,14 @@ class FundDepositForm(BaseForm):
         Returns:
             True if validation passes, False otherwise
         """
-        # Validate amount_delta
-        amount_delta = self._validate_decimal('amount_delta', allow_zero=False)
-        if amount_delta is not None:
-            self.cleaned_data['amount_delta'] = amount_delta
+        # Validate amount_delta and notes
+        if self._validate_amount_delta_and_notes('amount_delta', 'notes'):
             self.cleaned_data['fund_id'] = self.fund_id
 
-        # Get notes (optional)
-        self.cleaned_data['notes'] = self._get_string('notes', default='')
-
         # Validate date (required)
-        date_str = self._get_string('deposit_date', default='')
-        if not date_str:
-            self.errors['deposit_date'] = 'Required.'
-        else:
-            from datetime import datetime
-            try:
-                self.cleaned_data['date'] = datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                self.errors['deposit_date'] = 'Invalid date format. Use YYYY-MM-DD.'
+        date = self._validate_date('deposit_date')
+        if date is not None:
+            self.cleaned_data['date'] = date
 
         return not self.has_errors()
 
@@ -110,25 +94,14 @@ class FundWithdrawForm(BaseForm):
         Returns:
             True if validation passes, False otherwise
         """
-        # Validate amount_delta
-        amount_delta = self._validate_decimal('amount_delta', allow_zero=False)
-        if amount_delta is not None:
-            self.cleaned_data['amount_delta'] = amount_delta
+        # Validate amount_delta and notes
+        if self._validate_amount_delta_and_notes('amount_delta', 'notes'):
             self.cleaned_data['fund_id'] = self.fund_id
 
-        # Get notes (optional)
-        self.cleaned_data['notes'] = self._get_string('notes', default='')
-
         # Validate date (required)
-        date_str = self._get_string('withdraw_date', default='')
-        if not date_str:
-            self.errors['withdraw_date'] = 'Required.'
-        else:
-            from datetime import datetime
-            try:
-                self.cleaned_data['date'] = datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                self.errors['withdraw_date'] = 'Invalid date format. Use YYYY-MM-DD.'
+        date = self._validate_date('withdraw_date')
+        if date is not None:
+            self.cleaned_data['date'] = date
 
         return not self.has_errors()
 
@@ -146,24 +119,14 @@ class FundEventEditForm(BaseForm):
         Returns:
             True if validation passes, False otherwise
         """
-        # Validate amount_delta
-        amount_delta = self._validate_decimal('edit_event_amount', allow_zero=False)
-        if amount_delta is not None:
-            self.cleaned_data['amount_delta'] = amount_delta
+        # Validate amount_delta and notes
+        if self._validate_amount_delta_and_notes('edit_event_amount', 'edit_event_notes'):
             self.cleaned_data['event_id'] = self.event_id
 
-        # Get notes (optional)
-        self.cleaned_data['notes'] = self._get_string('edit_event_notes', default='')
-
         # Validate date (if provided)
-        date_str = self._get_string('date', default='')
-        if date_str:
-            from datetime import datetime
-            try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                self.cleaned_data['date'] = date_obj
-            except ValueError:
-                self.errors['date'] = 'Invalid date format. Use YYYY-MM-DD.'
+        date = self._validate_date('date', required=False)
+        if date is not None:
+            self.cleaned_data['date'] = date
 
         return not self.has_errors()
 
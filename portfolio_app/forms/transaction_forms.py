@@ -1,8 +1,8 @@
 """Forms for transaction-related operations."""
 
-from decimal import Decimal
 from typing import List
 from portfolio_app.forms.base_form import BaseForm
+from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator, ZERO
 from portfolio_app.models.fund import Fund
 from config import Config
 
@@ -19,6 +19,7 @@ class TransactionAddForm(BaseForm):
         """
         super().__init__(data)
         self.funds = funds
+        self._funds_by_id = {f.id: f for f in funds}
 
     def validate(self) -> bool:
         """Validate transaction add form.
@@ -27,26 +28,23 @@ class TransactionAddForm(BaseForm):
             True if validation passes, False otherwise
         """
         # Validate fund_id
-        fund_id_str = (self.data.get('fund_id') or '').strip()
-        try:
-            fund_id = int(fund_id_str) if fund_id_str else 0
-            if fund_id <= 0:
-                self.errors['fund_id'] = 'Select a category.'
-            else:
-                # Find fund in list
-                fund = next((f for f in self.funds if f.id == fund_id), None)
-                if not fund:
-                    self.errors['fund_id'] = 'Category not found.'
-                else:
-                    self.cleaned_data['fund_id'] = fund_id
-                    self.cleaned_data['fund'] = fund
-        except (ValueError, TypeError):
+        fund_id = self._int_field('fund_id')
+        if fund_id is None:
             self.errors['fund_id'] = 'Invalid category.'
+        elif fund_id <= 0:
+            self.errors['fund_id'] = 'Select a category.'
+        else:
+            fund = self._funds_by_id.get(fund_id)
+            if not fund:
+                self.errors['fund_id'] = 'Category not found.'
+            else:
+                self.cleaned_data['fund_id'] = fund_id
+                self.cleaned_data['fund'] = fund
 
         # Validate transaction_type
         transaction_type = self._validate_choice(
             'transaction_type',
-            Config.TRANSACTION_TYPES,
+            Config.TRANSACTION_TYPES_SET,
             'Select a transaction type.'
         )
         if transaction_type:
@@ -55,7 +53,7 @@ class TransactionAddForm(BaseForm):
         # Validate symbol
         symbol = self._validate_required_string('symbol', 'Symbol is required.')
         if symbol:
-            self.cleaned_data['symbol'] = symbol.upper()
+            self.cleaned_data['symbol'] = PortfolioCalculator.normalize_symbol(symbol)
 
         # Validate price
         price = self._validate_decimal('price', allow_zero=False)
@@ -72,21 +70,15 @@ class TransactionAddForm(BaseForm):
         if fees is not None:
             self.cleaned_data['fees'] = fees
         elif 'fees' not in self.errors:
-            self.cleaned_data['fees'] = Decimal('0')
+            self.cleaned_data['fees'] = ZERO
 
         # Get notes (optional)
         self.cleaned_data['notes'] = self._get_string('notes', default='')
 
         # Validate date (required)
-        date_str = self._get_string('date', default='')
-        if not date_str:
-            self.errors['date'] = 'Required.'
-        else:
-            from datetime import datetime
-            try:
-                self.cleaned_data['date'] = datetime.strptime(date_str, '%Y-%m-%d')
-            except ValueError:
-                self.errors['date'] = 'Invalid date format. Use YYYY-MM-DD.'
+        date = self._validate_date('date')
+        if date is not None:
+            self.cleaned_data['date'] = date
 
         return not self.has_errors()
 
@@ -117,7 +109,7 @@ class TransactionEditForm(BaseForm):
         # Validate symbol (if provided)
         symbol = self._get_string('edit_symbol', default='')
         if symbol:
-            self.cleaned_data['symbol'] = symbol.upper()
+            self.cleaned_data['symbol'] = PortfolioCalculator.normalize_symbol(symbol)
 
         # Validate price (if provided)
         price_str = self._get_string('edit_price', default='')
@@ -146,14 +138,9 @@ class TransactionEditForm(BaseForm):
             self.cleaned_data['notes'] = notes
 
         # Validate date (if provided)
-        date_str = self._get_string('edit_date', default='')
-        if date_str:
-            from datetime import datetime
-            try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                self.cleaned_data['date'] = date_obj
-            except ValueError:
-                self.errors['edit_date'] = 'Invalid date format. Use YYYY-MM-DD.'
+        date = self._validate_date('edit_date', required=False)
+        if date is not None:
+            self.cleaned_data['date'] = date
 
         return not self.has_errors()
 
@@ -170,6 +157,7 @@ class AssetAddForm(BaseForm):
         """
         super().__init__(data)
         self.funds = funds
+        self._funds_by_id = {f.id: f for f in funds}
 
     def validate(self) -> bool:
         """Validate asset add form.
@@ -178,24 +166,20 @@ class AssetAddForm(BaseForm):
             True if validation passes, False otherwise
         """
         # Validate fund_id
-        fund_id_str = (self.data.get('asset_fund_id') or '').strip()
-        try:
-            fund_id = int(fund_id_str) if fund_id_str else 0
-            if fund_id <= 0:
-                self.errors['asset_fund_id'] = 'Select a category.'
-            else:
-                fund = next((f for f in self.funds if f.id == fund_id), None)
-                if not fund:
-                    self.errors['asset_fund_id'] = 'Category not found.'
-                else:
-                    self.cleaned_data['fund_id'] = fund_id
-        except (ValueError, TypeError):
+        fund_id = self._int_field('asset_fund_id')
+        if fund_id is None:
             self.errors['asset_fund_id'] = 'Invalid category.'
+        elif fund_id <= 0:
+            self.errors['asset_fund_id'] = 'Select a category.'
+        elif fund_id not in self._funds_by_id:
+            self.errors['asset_fund_id'] = 'Category not found.'
+        else:
+            self.cleaned_data['fund_id'] = fund_id
 
         # Validate symbol
         symbol = self._validate_required_string('asset_symbol', 'Symbol is required.')
         if symbol:
-            self.cleaned_data['symbol'] = symbol.upper()
+            self.cleaned_data['symbol'] = PortfolioCalculator.normalize_symbol(symbol)
 
         return not self.has_errors()
 
@@ -218,19 +202,15 @@ class AssetDeleteForm(BaseForm):
             True if validation passes, False otherwise
         """
         # Validate fund_id
-        fund_id_str = (self.data.get('delete_asset_fund_id') or '').strip()
-        try:
-            fund_id = int(fund_id_str) if fund_id_str else 0
-            if fund_id <= 0:
-                self.errors['delete_asset_fund_id'] = 'Invalid fund ID.'
-            else:
-                self.cleaned_data['fund_id'] = fund_id
-        except (ValueError, TypeError):
+        fund_id = self._int_field('delete_asset_fund_id')
+        if fund_id is None or fund_id <= 0:
             self.errors['delete_asset_fund_id'] = 'Invalid fund ID.'
+        else:
+            self.cleaned_data['fund_id'] = fund_id
 
         # Validate symbol
         symbol = self._validate_required_string('delete_asset_symbol', 'Symbol is required.')
         if symbol:
-            self.cleaned_data['symbol'] = symbol.upper()
+            self.cleaned_data['symbol'] = PortfolioCalculator.normalize_symbol(symbol)
 
         return not self.has_errors()
@@ -5,5 +5,6 @@ from portfolio_app.models.fund import Fund
 from portfolio_app.models.transaction import Transaction
 from portfolio_app.models.asset import Asset
 from portfolio_app.models.fund_event import FundEvent
+from portfolio_app.models.fund_summary_cache import FundSummaryCache
 
-__all__ = ['User', 'Fund', 'Transaction', 'Asset', 'FundEvent']
+__all__ = ['User', 'Fund', 'Transaction', 'Asset', 'FundEvent', 'FundSummaryCache']
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from sqlalchemy import UniqueConstraint, Index
+from sqlalchemy.orm import validates
 from portfolio_app import db
+from portfolio_app.utils.formatting import fmt_date
 
 
 class Asset(db.Model):
@@ -25,12 +27,17 @@ class Asset(db.Model):
         Index('ix_asset_fund_symbol', fund_id, symbol),
     )
 
+    @validates('symbol')
+    def _normalize_symbol(self, key, symbol):
+        """Store symbols upper-cased so lookups can match them exactly."""
+        return symbol.strip().upper() if symbol is not None else None
+
     def to_dict(self):
         return {
             'id': self.id,
             'fund_id': self.fund_id,
             'category': self.fund.category if getattr(self, 'fund', None) else None,
-            'symbol': (self.symbol or '').upper(),
-            'created_at': self.created_at.strftime('%Y-%m-%d') if self.created_at else None,
-            'updated_at': self.updated_at.strftime('%Y-%m-%d') if self.updated_at else None,
+            'symbol': self.symbol or '',
+            'created_at': fmt_date(self.created_at) or None,
+            'updated_at': fmt_date(self.updated_at) or None,
         }
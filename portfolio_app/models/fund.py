@@ -4,6 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from sqlalchemy import Numeric
 from portfolio_app import db
+from portfolio_app.utils.formatting import fmt_date
 
 
 class Fund(db.Model):
@@ -19,8 +20,14 @@ class Fund(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    transactions = db.relationship('Transaction', backref='fund', lazy='dynamic', cascade='all, delete-orphan')
-    events = db.relationship('FundEvent', backref='fund', lazy='dynamic', cascade='all, delete-orphan')
+    # passive_deletes: FundRepository.delete() removes dependents in bulk.
+    # The children's ondelete='CASCADE' only exists on tables created from
+    # these models (create_all() never alters an existing FK), so nothing
+    # relies on it.
+    transactions = db.relationship('Transaction', backref='fund', lazy='dynamic',
+                                   cascade='all, delete-orphan', passive_deletes=True)
+    events = db.relationship('FundEvent', backref='fund', lazy='dynamic',
+                             cascade='all, delete-orphan', passive_deletes=True)
 
     def to_dict(self):
         """Convert model to dictionary"""
@@ -28,6 +35,6 @@ class Fund(db.Model):
             'id': self.id,
             'category': self.category,
             'amount': float(self.amount),
-            'created_at': self.created_at.strftime('%Y-%m-%d'),
-            'updated_at': self.updated_at.strftime('%Y-%m-%d')
+            'created_at': fmt_date(self.created_at),
+            'updated_at': fmt_date(self.updated_at)
         }
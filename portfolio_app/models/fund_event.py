@@ -3,6 +3,7 @@
 from datetime import datetime
 from sqlalchemy import Numeric, Index
 from portfolio_app import db
+from portfolio_app.utils.formatting import fmt_date, fmt_datetime
 
 
 class FundEvent(db.Model):
@@ -11,7 +12,7 @@ class FundEvent(db.Model):
     __tablename__ = 'capital_event'
 
     id = db.Column(db.Integer, primary_key=True)
-    fund_id = db.Column('capital_id', db.Integer, db.ForeignKey('capital.id'), nullable=False)
+    fund_id = db.Column('capital_id', db.Integer, db.ForeignKey('capital.id', ondelete='CASCADE'), nullable=False)
 
     # Initial / Deposit / Withdrawal
     event_type = db.Column(db.String(20), nullable=False)
@@ -28,12 +29,8 @@ class FundEvent(db.Model):
 
     @property
     def date_short(self):
-        if not self.date:
-            return ''
-        return self.date.strftime('%Y-%m-%d')
+        return fmt_date(self.date)
 
     @property
     def date_full(self):
-        if not self.date:
-            return ''
-        return self.date.strftime('%Y-%m-%d %H:%M')
+        return fmt_datetime(self.date)
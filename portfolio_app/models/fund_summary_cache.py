@@ -0,0 +1,66 @@
+"""FundSummaryCache model for precomputed per-symbol transaction summaries."""
+
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import Numeric, String, UniqueConstraint
+from sqlalchemy.types import TypeDecorator
+from portfolio_app import db
+
+
+class _CacheAmount(TypeDecorator):
+    """Numeric(20, 10) that SQLite stores as text.
+
+    SQLite keeps NUMERIC values as 8-byte floats, which drop the trailing
+    digits of large cached totals; text keeps them equal to the Decimal
+    walk. Other databases use a real NUMERIC column.
+    """
+
+    impl = Numeric(20, 10)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'sqlite':
+            return dialect.type_descriptor(String(64))
+        return dialect.type_descriptor(Numeric(20, 10))
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and dialect.name == 'sqlite':
+            return str(value)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and dialect.name == 'sqlite':
+            return Decimal(value)
+        return value
+
+
+class FundSummaryCache(db.Model):
+    """Materialized average-cost summary for one (fund, symbol) pair.
+
+    Rows are rebuilt whenever a transaction of the pair is written (see
+    portfolio_app.calculators.summary_cache), so dashboard reads can sum this
+    table instead of walking every transaction.
+    """
+
+    __tablename__ = 'fund_summary_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    fund_id = db.Column('capital_id', db.Integer, db.ForeignKey('capital.id', ondelete='CASCADE'), nullable=False)
+    symbol = db.Column(db.String(20), nullable=False)
+
+    transaction_count = db.Column(db.Integer, nullable=False, default=0)
+    last_tx_id = db.Column(db.Integer, nullable=True)
+
+    total_buy_cost = db.Column(_CacheAmount, nullable=False, default=0)
+    total_sell_cost = db.Column(_CacheAmount, nullable=False, default=0)
+    total_quantity_held = db.Column(_CacheAmount, nullable=False, default=0)
+    current_invested = db.Column(_CacheAmount, nullable=False, default=0)
+    realized_pnl = db.Column(_CacheAmount, nullable=False, default=0)
+    realized_cost_basis = db.Column(_CacheAmount, nullable=False, default=0)
+    realized_proceeds = db.Column(_CacheAmount, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(fund_id, symbol, name='uq_fund_summary_cache_capital_symbol'),
+    )
@@ -2,8 +2,17 @@
 
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Numeric, CheckConstraint
+from sqlalchemy import Numeric, CheckConstraint, Index
+from sqlalchemy.orm import validates
 from portfolio_app import db
+from portfolio_app.utils.formatting import fmt_date, fmt_datetime, fmt_date_abbr, fmt_datetime_long
+
+
+def _as_decimal(value) -> Decimal:
+    """Return value as a Decimal, skipping the str round-trip when it already is one."""
+    if type(value) is Decimal:
+        return value
+    return Decimal(str(value))
 
 
 class Transaction(db.Model):
@@ -11,7 +20,7 @@ class Transaction(db.Model):
     __tablename__ = 'transaction'
 
     id = db.Column(db.Integer, primary_key=True)
-    fund_id = db.Column('capital_id', db.Integer, db.ForeignKey('capital.id'), nullable=False)
+    fund_id = db.Column('capital_id', db.Integer, db.ForeignKey('capital.id', ondelete='CASCADE'), nullable=False)
     transaction_type = db.Column(db.String(10), nullable=False)  # Buy or Sell
     symbol = db.Column(db.String(20), nullable=True)
     # NOTE: Use higher precision to support crypto-style pricing (e.g. 0.0002344)
@@ -25,15 +34,11 @@ class Transaction(db.Model):
 
     @property
     def date_short(self):
-        if not self.date:
-            return ''
-        return self.date.strftime('%Y-%m-%d')
+        return fmt_date(self.date)
 
     @property
     def date_full(self):
-        if not self.date:
-            return ''
-        return self.date.strftime('%Y-%m-%d %H:%M')
+        return fmt_datetime(self.date)
 
     # Constraints
     __table_args__ = (
@@ -41,17 +46,24 @@ class Transaction(db.Model):
         CheckConstraint('quantity > 0', name='check_quantity_positive'),
         CheckConstraint('fees >= 0', name='check_fees_non_negative'),
         CheckConstraint('total_cost >= 0', name='check_total_cost_non_negative'),
+        # Covers the per-symbol filter + chronological sort of the calculators.
+        Index('ix_transaction_fund_symbol_date', fund_id, symbol, date),
     )
 
+    @validates('symbol')
+    def _normalize_symbol(self, key, symbol):
+        """Store symbols upper-cased so lookups can match them exactly."""
+        return symbol.strip().upper() if symbol is not None else None
+
     def calculate_total_cost(self):
         """Calculate and update total_cost based on transaction type.
 
         This is a simple calculation method that updates the total_cost column
         from existing model data (price, quantity, fees).
         """
-        price = Decimal(str(self.price))
-        quantity = Decimal(str(self.quantity))
-        fees = Decimal(str(self.fees))
+        price = _as_decimal(self.price)
+        quantity = _as_decimal(self.quantity)
+        fees = _as_decimal(self.fees)
         gross = price * quantity
 
         if self.transaction_type == 'Sell':
@@ -66,14 +78,14 @@ class Transaction(db.Model):
             'fund_id': self.fund_id,
             'category': self.fund.category,
             'transaction_type': self.transaction_type,
-            'symbol': (self.symbol or '').upper(),
+            'symbol': self.symbol or '',
             'price': float(self.price),
             'quantity': float(self.quantity),
             'fees': float(self.fees),
             'total_cost': float(self.total_cost),
             'average_cost': float(self.average_cost),
-            'date': self.date.strftime('%Y-%m-%d %H:%M'),
-            'date_short': self.date.strftime('%b %d, %Y'),
-            'date_full': self.date.strftime('%B %d, %Y at %H:%M'),
+            'date': fmt_datetime(self.date),
+            'date_short': fmt_date_abbr(self.date),
+            'date_full': fmt_datetime_long(self.date),
             'notes': self.notes or ''
         }
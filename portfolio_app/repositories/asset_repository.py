@@ -1,8 +1,9 @@
 """Asset repository for database operations on Asset model."""
 
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from portfolio_app.repositories.base import BaseRepository
 from portfolio_app.models.asset import Asset
+from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator
 
 
 class AssetRepository(BaseRepository[Asset]):
@@ -20,7 +21,7 @@ class AssetRepository(BaseRepository[Asset]):
         """
         return self.model.query.filter_by(
             fund_id=fund_id,
-            symbol=symbol.strip().upper()
+            symbol=PortfolioCalculator.normalize_symbol(symbol)
         ).first()
 
     def get_by_fund_id(self, fund_id: int) -> List[Asset]:
@@ -33,3 +34,21 @@ class AssetRepository(BaseRepository[Asset]):
             List of assets for the fund
         """
         return self.model.query.filter_by(fund_id=fund_id).all()
+
+    def get_by_fund_ids(self, fund_ids: Iterable[int]) -> Dict[int, List[Asset]]:
+        """Get the assets of several funds in one query.
+
+        Args:
+            fund_ids: The fund IDs
+
+        Returns:
+            Dict of fund ID to its assets (funds without assets are absent)
+        """
+        fund_ids = list(fund_ids)
+        if not fund_ids:
+            return {}
+
+        assets_by_fund = {}
+        for asset in self.model.query.filter(Asset.fund_id.in_(fund_ids)):
+            assets_by_fund.setdefault(asset.fund_id, []).append(asset)
+        return assets_by_fund
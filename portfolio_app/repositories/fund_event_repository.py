@@ -1,6 +1,6 @@
 """FundEvent repository for database operations on FundEvent model."""
 
-from typing import List
+from typing import Dict, Iterable, List
 from portfolio_app.repositories.base import BaseRepository
 from portfolio_app.models.fund_event import FundEvent
 
@@ -20,3 +20,25 @@ class FundEventRepository(BaseRepository[FundEvent]):
         return self.model.query.filter_by(
             fund_id=fund_id
         ).order_by(FundEvent.date.asc()).all()
+
+    def get_by_fund_ids(self, fund_ids: Iterable[int]) -> Dict[int, List[FundEvent]]:
+        """Get the events of several funds in one query.
+
+        Args:
+            fund_ids: The fund IDs
+
+        Returns:
+            Dict of fund ID to its events ordered by date (funds without
+            events are absent)
+        """
+        fund_ids = list(fund_ids)
+        if not fund_ids:
+            return {}
+
+        events_by_fund = {}
+        events = self.model.query.filter(
+            FundEvent.fund_id.in_(fund_ids)
+        ).order_by(FundEvent.date.asc(), FundEvent.id.asc()).all()
+        for event in events:
+            events_by_fund.setdefault(event.fund_id, []).append(event)
+        return events_by_fund
@@ -1,8 +1,14 @@
 """Fund repository for database operations on Fund model."""
 
 from typing import Optional, List
+from sqlalchemy import delete
 from portfolio_app.repositories.base import BaseRepository
+from portfolio_app.models.asset import Asset
 from portfolio_app.models.fund import Fund
+from portfolio_app.models.fund_event import FundEvent
+from portfolio_app.models.fund_summary_cache import FundSummaryCache
+from portfolio_app.models.transaction import Transaction
+from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator
 
 
 class FundRepository(BaseRepository[Fund]):
@@ -20,8 +26,8 @@ class FundRepository(BaseRepository[Fund]):
         return q
 
     def get_all(self) -> List[Fund]:
-        """Get all funds belonging to the current user."""
-        return self._base_query().all()
+        """Get all funds belonging to the current user (cached per request)."""
+        return PortfolioCalculator.get_funds(self._user_id)
 
     def get_by_id(self, id: int) -> Optional[Fund]:
         """Get a fund by ID, scoped to the current user for security."""
@@ -31,6 +37,27 @@ class FundRepository(BaseRepository[Fund]):
         """Get fund by category name within the current user's portfolio."""
         return self._base_query().filter_by(category=category).first()
 
+    def category_exists(self, category: str) -> bool:
+        """Check whether the current user already has a fund for a category."""
+        return self.db.session.query(
+            self._base_query().filter_by(category=category).exists()
+        ).scalar()
+
+    def delete(self, entity: Fund) -> None:
+        """Delete a fund with its events, transactions, assets and cached summaries.
+
+        Dependent rows go in one DELETE per table instead of being loaded
+        and removed one at a time by the ORM cascade, and all of them go
+        before the fund row so enforced foreign keys never see an orphan.
+        """
+        for model in (Transaction, FundEvent, Asset, FundSummaryCache):
+            self.db.session.execute(
+                delete(model)
+                .where(model.fund_id == entity.id)
+                .execution_options(synchronize_session=False)
+            )
+        super().delete(entity)
+
     def get_available_categories(self, all_categories: List[str]) -> List[str]:
         """Get categories not yet used by the current user."""
         existing = {f.category for f in self.get_all()}
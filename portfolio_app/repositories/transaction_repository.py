@@ -3,6 +3,7 @@
 from typing import List
 from portfolio_app.repositories.base import BaseRepository
 from portfolio_app.models.transaction import Transaction
+from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator
 
 
 class TransactionRepository(BaseRepository[Transaction]):
@@ -31,5 +32,5 @@ class TransactionRepository(BaseRepository[Transaction]):
         """
         return self.model.query.filter_by(
             fund_id=fund_id,
-            symbol=symbol.strip().upper()
+            symbol=PortfolioCalculator.normalize_symbol(symbol)
         ).order_by(Transaction.date.asc()).all()
@@ -1,7 +1,10 @@
 """User repository for database operations on User model."""
 
-from typing import Optional
+from typing import List, Optional
+from sqlalchemy import delete, update
+from sqlalchemy.engine import Row
 from portfolio_app.repositories.base import BaseRepository
+from portfolio_app.models.fund import Fund
 from portfolio_app.models.user import User
 
 
@@ -19,6 +22,61 @@ class UserRepository(BaseRepository[User]):
         """
         return self.model.query.filter_by(username=username).first()
 
+    def username_exists(self, username: str) -> bool:
+        """Check whether a username is taken (case-sensitive) without loading the user."""
+        return self.db.session.query(
+            self.model.query.filter_by(username=username).exists()
+        ).scalar()
+
     def count(self) -> int:
         """Return total number of registered users."""
         return self.model.query.count()
+
+    def delete_other_user(self, user_id: int, acting_user_id: int) -> bool:
+        """Delete a user other than the acting one and detach their funds.
+
+        The funds are un-owned with one UPDATE first, as the ORM would have
+        done row by row, so the user row is no longer referenced when the
+        DELETE runs. Both statements carry the self-guard in their WHERE
+        clause.
+
+        Args:
+            user_id: The user to delete
+            acting_user_id: The user performing the deletion (never deleted)
+
+        Returns:
+            True if a user was deleted, False if no such other user exists
+        """
+        self.db.session.execute(
+            update(Fund)
+            .where(Fund.user_id == user_id, Fund.user_id != acting_user_id)
+            .values(user_id=None)
+        )
+        deleted = self.db.session.execute(
+            delete(User).where(User.id == user_id, User.id != acting_user_id)
+        ).rowcount
+        return bool(deleted)
+
+    def page_after(self, after_id: int = 0, limit: int = 100) -> List[Row]:
+        """Return one page of users for the admin list (keyset pagination).
+
+        Only the listed columns are selected, so password hashes are never
+        loaded, and seeking past ``after_id`` on the primary key keeps every
+        page as cheap as the first.
+
+        Args:
+            after_id: Last user ID of the previous page (0 for the first page)
+            limit: Maximum number of users to return
+
+        Returns:
+            Rows of (id, username, is_admin, created_at, last_login) ordered by ID
+        """
+        return (
+            self.db.session.query(
+                User.id, User.username, User.is_admin, User.created_at, User.last_login
+            )
+            .filter(User.id > after_id)
+            .order_by(User.id)
+            .limit(limit)
+            .all()
+        )
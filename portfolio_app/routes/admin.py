@@ -10,6 +10,9 @@ logger = logging.getLogger(__name__)
 
 admin_bp = Blueprint('admin', __name__)
 
+# Users listed per admin page
+USERS_PAGE_SIZE = 100
+
 
 def admin_required(f):
     """Decorator: allow access only to admin users."""
@@ -27,8 +30,15 @@ def admin_required(f):
 def users():
     """Admin user list page."""
     svc = get_services()
-    all_users = svc.user_repo.get_all()
-    return render_template('admin/users.html', users=all_users)
+    after_id = request.args.get('after', 0, type=int)
+    page = svc.user_repo.page_after(after_id, USERS_PAGE_SIZE + 1)
+    next_after = page[USERS_PAGE_SIZE - 1].id if len(page) > USERS_PAGE_SIZE else None
+    return render_template(
+        'admin/users.html',
+        users=page[:USERS_PAGE_SIZE],
+        user_count=svc.user_repo.count(),
+        next_after=next_after,
+    )
 
 
 @admin_bp.route('/users/<int:user_id>/reset-password', methods=['POST'])
@@ -58,7 +58,7 @@ def register():
         svc = get_services()
 
         def username_taken(username: str) -> bool:
-            return svc.user_repo.get_by_username(username) is not None
+            return svc.user_repo.username_exists(username)
 
         form = RegisterForm(request.form, check_username_taken=username_taken)
         if form.validate():
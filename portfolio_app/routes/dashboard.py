@@ -1,7 +1,7 @@
 """Dashboard blueprint - Portfolio summary and API endpoints."""
 
 import logging
-from flask import Blueprint, render_template, jsonify, request, Response
+from flask import Blueprint, current_app, render_template, jsonify, request, Response
 from flask_login import login_required
 from decimal import Decimal
 from portfolio_app.services import get_services
@@ -13,15 +13,21 @@ logger = logging.getLogger(__name__)
 dashboard_bp = Blueprint('dashboard', __name__)
 
 
-def _jsonify_decimals(value):
-    """Convert Decimal values to float for JSON serialization."""
+def _decimal_default(value):
+    """json.dumps fallback: Decimals become floats, anything else goes to Flask's default."""
     if isinstance(value, Decimal):
         return float(value)
-    if isinstance(value, dict):
-        return {k: _jsonify_decimals(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple)):
-        return [_jsonify_decimals(v) for v in value]
-    return value
+    return current_app.json.default(value)
+
+
+def _decimal_json_response(payload) -> Response:
+    """Serialize a payload holding Decimals in one encoder pass.
+
+    The encoder calls _decimal_default only for the Decimals it meets, so
+    no converted copy of the payload is built first.
+    """
+    body = current_app.json.dumps(payload, default=_decimal_default, separators=(',', ':'))
+    return current_app.response_class(f'{body}\n', mimetype=current_app.json.mimetype)
 
 
 @dashboard_bp.route('/')
@@ -56,10 +62,10 @@ def api_portfolio_summary() -> Response:
     svc = get_services()
     summary, total_value = svc.portfolio_service.get_portfolio_summary()
 
-    return jsonify(_jsonify_decimals({
+    return _decimal_json_response({
         'summary': summary,
         'total_value': total_value
-    }))
+    })
 
 
 @dashboard_bp.route('/api/holdings')
@@ -3,9 +3,7 @@
 import logging
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
-from decimal import Decimal
 from portfolio_app import db
-from portfolio_app.models import FundEvent
 from portfolio_app.services import get_services
 from portfolio_app.forms import (
     FundAddForm,
@@ -14,9 +12,8 @@ from portfolio_app.forms import (
     FundEventEditForm,
     FundEventDeleteForm
 )
-from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator
 from portfolio_app.utils import get_error_message, get_first_form_error, SuccessMessages, is_ajax_request, json_response
-from portfolio_app.utils.constants import EventType, safe_html_id
+from portfolio_app.utils.constants import safe_html_id
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -31,44 +28,25 @@ def _get_funds_page_context():
     funds = svc.fund_repo.get_all()
     available_categories = svc.fund_repo.get_available_categories(Config.ASSET_CATEGORIES)
 
+    events_by_fund = svc.event_repo.get_by_fund_ids(f.id for f in funds)
+
     funds_data = []
     for fund in funds:
-        events = svc.event_repo.get_by_fund_id(fund.id)
-
-        # Legacy backfill: create an Initial event for old funds that have
-        # a balance but no event history.  Skipped when amount=0 (user may
-        # have intentionally deleted all events — show Deposit button instead).
-        if not events and fund.amount and Decimal(str(fund.amount)) != 0:
-            try:
-                backfill = FundEvent(
-                    fund_id=fund.id,
-                    event_type=EventType.INITIAL,
-                    amount_delta=Decimal(str(fund.amount)),
-                    date=fund.created_at,
-                    notes=None,
-                )
-                db.session.add(backfill)
-                db.session.commit()
-                events = [backfill]
-            except Exception:
-                logger.exception('Failed to backfill events for fund %s', fund.id)
-                db.session.rollback()
-
-        total_funds = PortfolioCalculator.get_total_funds_for_fund(fund.id)
-        cash = PortfolioCalculator.get_cash_balance_for_fund(fund.id)
-        tx_summary = PortfolioCalculator.get_category_transactions_summary(fund.id)
-        current_invested = tx_summary['current_invested']
-
         group_id = safe_html_id(fund.id, fund.category)
         funds_data.append({
             'fund': fund,
-            'events': events,
+            'events': events_by_fund.get(fund.id, []),
             'group_id': group_id,
-            'total_funds': total_funds,
-            'cash': cash,
-            'current_invested': current_invested,
         })
 
+    # Totals for every fund in a fixed number of queries
+    fund_metrics = svc.portfolio_service.get_fund_metrics()
+    for data in funds_data:
+        metrics = fund_metrics[data['fund'].id]
+        data['total_funds'] = metrics['total_funds']
+        data['cash'] = metrics['cash']
+        data['current_invested'] = metrics['current_invested']
+
     return {
         'funds': funds,
         'funds_data': funds_data,
@@ -19,50 +19,45 @@ logger = logging.getLogger(__name__)
 transactions_bp = Blueprint('transactions', __name__)
 
 
+def _decimal_places(value) -> int:
+    """Count significant fractional digits (1.50 -> 1, 100 -> 0)."""
+    if value is None:
+        return 0
+    d = value if isinstance(value, Decimal) else Decimal(str(value))
+    exponent = d.normalize().as_tuple().exponent
+    return -exponent if exponent < 0 else 0
+
+
 def _get_transactions_page_context(category_filter=''):
     """Get context data for transactions page."""
     svc = get_services()
-    fund_repo, transaction_repo, asset_repo = svc.fund_repo, svc.transaction_repo, svc.asset_repo
+    fund_repo, asset_repo = svc.fund_repo, svc.asset_repo
     category_filter = (category_filter or '').strip()
     funds = fund_repo.get_all()
     symbol_data = []
 
-    def _decimal_places(value) -> int:
-        if value is None:
-            return 0
-        d = Decimal(str(value))
-        s = format(d, 'f')
-        if '.' not in s:
-            return 0
-        fractional = s.split('.', 1)[1].rstrip('0')
-        return len(fractional)
+    listed_funds = [f for f in funds if not category_filter or f.category == category_filter]
+    listed_ids = [f.id for f in listed_funds]
 
-    for fund in funds:
-        if category_filter and fund.category != category_filter:
-            continue
+    # Assets and transactions of every listed fund, one query each
+    try:
+        assets_by_fund = asset_repo.get_by_fund_ids(listed_ids)
+    except OperationalError:
+        assets_by_fund = {}
+    transactions_by_fund = PortfolioCalculator.get_transactions_by_fund_and_symbol(listed_ids)
 
+    for fund in listed_funds:
         tracked_symbols = set()
         asset_by_symbol = {}
+        for a in assets_by_fund.get(fund.id, []):
+            sym_norm = PortfolioCalculator.normalize_symbol(a.symbol)
+            if sym_norm:
+                asset_by_symbol[sym_norm] = a
+                tracked_symbols.add(sym_norm)
 
-        try:
-            fund_assets = asset_repo.get_by_fund_id(fund.id)
-            for a in fund_assets:
-                sym_norm = PortfolioCalculator.normalize_symbol(a.symbol)
-                if sym_norm:
-                    asset_by_symbol[sym_norm] = a
-                    tracked_symbols.add(sym_norm)
-        except OperationalError:
-            asset_by_symbol = {}
-
-        fund_transactions = transaction_repo.get_by_fund_id(fund.id)
-
-        transactions_by_symbol = {}
-        for t in fund_transactions:
-            sym_norm = PortfolioCalculator.normalize_symbol(t.symbol)
-            if not sym_norm:
-                continue
-            transactions_by_symbol.setdefault(sym_norm, []).append(t)
-            tracked_symbols.add(sym_norm)
+        # Keys are the fund's distinct traded symbols
+        transactions_by_symbol = transactions_by_fund.get(fund.id, {})
+        tracked_symbols.update(transactions_by_symbol)
 
         for sym_norm in sorted(tracked_symbols):
             transactions = transactions_by_symbol.get(sym_norm, [])
@@ -76,8 +71,8 @@ def _get_transactions_page_context(category_filter=''):
 
             # Per-symbol ROI: realized P&L vs cost basis of sold shares
             try:
-                realized_pnl = Decimal(str(summary.get('realized_pnl', 0) or 0))
-                cost_basis = Decimal(str(summary.get('realized_cost_basis', 0) or 0))
+                realized_pnl = summary['realized_pnl']
+                cost_basis = summary['realized_cost_basis']
 
                 if cost_basis != 0:
                     roi = (realized_pnl / abs(cost_basis)) * Decimal('100')
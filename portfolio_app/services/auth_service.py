@@ -30,7 +30,7 @@ class AuthService:
         Raises:
             ValueError: If username is already taken
         """
-        if self.user_repo.get_by_username(username):
+        if self.user_repo.username_exists(username):
             raise ValueError('This username is already taken.')
 
         is_first = self.user_repo.count() == 0
@@ -127,10 +127,8 @@ class AuthService:
         Raises:
             ValueError: If user not found or trying to delete own account
         """
-        user = self.user_repo.get_by_id(user_id)
-        if not user:
-            raise ValueError('User not found.')
-        if user.id == current_user.id:
+        if user_id == current_user.id:
             raise ValueError('You cannot delete your own account.')
-        self.user_repo.delete(user)
+        if not self.user_repo.delete_other_user(user_id, current_user.id):
+            raise ValueError('User not found.')
         self.user_repo.commit()
@@ -6,6 +6,7 @@ from portfolio_app.models.fund import Fund
 from portfolio_app.models.fund_event import FundEvent
 from portfolio_app.repositories.fund_repository import FundRepository
 from portfolio_app.repositories.fund_event_repository import FundEventRepository
+from portfolio_app.calculators.portfolio_calculator import PortfolioCalculator
 from portfolio_app.utils.constants import EventType
 
 ZERO = Decimal('0')
@@ -29,7 +30,7 @@ class FundService:
 
     def create_fund(self, category: str, amount: Decimal, user_id: Optional[int] = None, notes: str = 'Initial funding', date: Optional[Any] = None) -> Fund:
         """Create new fund with initial deposit event."""
-        if self.fund_repo.get_by_category(category):
+        if self.fund_repo.category_exists(category):
             raise ValueError('Fund already exists')
 
         fund = Fund(category=category, amount=amount, user_id=user_id)
@@ -46,6 +47,7 @@ class FundService:
             event.date = date
         self.event_repo.add(event)
         self.fund_repo.commit()
+        PortfolioCalculator.invalidate_fund_cache()
 
         return fund
 
@@ -55,6 +57,7 @@ class FundService:
         category = fund.category
         self.fund_repo.delete(fund)
         self.fund_repo.commit()
+        PortfolioCalculator.invalidate_fund_cache()
         return category
 
     # ------------------------------------------------------------------
@@ -35,6 +35,14 @@ class PortfolioService:
         """
         return PortfolioCalculator.get_portfolio_dashboard_totals(user_id=self._user_id)
 
+    def get_fund_metrics(self) -> Dict[int, Dict[str, Decimal]]:
+        """Get total funds, cash and invested amounts for every fund at once.
+
+        Returns:
+            Dictionary mapping fund ID to its metrics
+        """
+        return PortfolioCalculator.get_fund_metrics(user_id=self._user_id)
+
     def get_category_transactions_summary(self, fund_id: int) -> Dict[str, Any]:
         """Get aggregated transaction summary for a category.
 
@@ -1,6 +1,13 @@
 """Utilities package for formatting and helper functions."""
 
-from portfolio_app.utils.formatting import fmt_decimal, fmt_money
+from portfolio_app.utils.formatting import (
+    fmt_decimal,
+    fmt_money,
+    fmt_date,
+    fmt_datetime,
+    fmt_date_abbr,
+    fmt_datetime_long,
+)
 from portfolio_app.utils.messages import (
     ErrorMessages,
     SuccessMessages,
@@ -14,6 +21,10 @@ from portfolio_app.utils.constants import EventType, safe_html_id
 __all__ = [
     'fmt_decimal',
     'fmt_money',
+    'fmt_date',
+    'fmt_datetime',
+    'fmt_date_abbr',
+    'fmt_datetime_long',
     'ErrorMessages',
     'SuccessMessages',
     'ConfirmMessages',
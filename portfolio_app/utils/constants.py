@@ -1,6 +1,7 @@
 """Application-wide constants — single source of truth for magic strings."""
 
 import re
+from functools import lru_cache
 
 
 class EventType:
@@ -14,6 +15,7 @@ class EventType:
 _HTML_ID_RE = re.compile(r'[^A-Za-z0-9_\-]+')
 
 
+@lru_cache(maxsize=1024)
 def safe_html_id(*parts) -> str:
     """Build a safe HTML element ID from arbitrary parts.
 
@@ -21,5 +23,8 @@ def safe_html_id(*parts) -> str:
     '3-Commodities'
     >>> safe_html_id(1, 'My Fund!')
     '1-My_Fund_'
+
+    Results are memoized: the same (id, name) pairs are rendered on every
+    page load.
     """
     return _HTML_ID_RE.sub('_', '-'.join(str(p) for p in parts))
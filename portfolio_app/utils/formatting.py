@@ -1,4 +1,4 @@
-"""Formatting utilities for decimal and money values."""
+"""Formatting utilities for decimal, money and date values."""
 
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 
@@ -74,3 +74,38 @@ def fmt_money(value, decimals=2):
         return format(d, 'f')
 
     return format(d, f",.{decimals_int}f")
+
+
+# Month names in the C locale, indexed by datetime.month.
+_MONTH_ABBR = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONTH_FULL = ('', 'January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December')
+
+
+def fmt_date(d):
+    """Format a date/datetime as YYYY-MM-DD ('' for None)."""
+    if not d:
+        return ''
+    return f'{d.year:04d}-{d.month:02d}-{d.day:02d}'
+
+
+def fmt_datetime(d):
+    """Format a datetime as YYYY-MM-DD HH:MM ('' for None)."""
+    if not d:
+        return ''
+    return f'{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}'
+
+
+def fmt_date_abbr(d):
+    """Format a date/datetime like strftime('%b %d, %Y') ('' for None)."""
+    if not d:
+        return ''
+    return f'{_MONTH_ABBR[d.month]} {d.day:02d}, {d.year:04d}'
+
+
+def fmt_datetime_long(d):
+    """Format a datetime like strftime('%B %d, %Y at %H:%M') ('' for None)."""
+    if not d:
+        return ''
+    return f'{_MONTH_FULL[d.month]} {d.day:02d}, {d.year:04d} at {d.hour:02d}:{d.minute:02d}'
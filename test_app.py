@@ -11,8 +11,9 @@ Tests cover:
   - Application routes (HTTP 200 checks)
 """
 
+from contextlib import contextmanager
 from portfolio_app import create_app, db
-from portfolio_app.models import Fund, Transaction, FundEvent
+from portfolio_app.models import Fund, Transaction, FundEvent, FundSummaryCache, Asset
 from portfolio_app.calculators import PortfolioCalculator
 from portfolio_app.services.factory import Services
 from datetime import datetime
@@ -48,6 +49,26 @@ def _assert(label: str, expected, actual, tol=_dec('0.01')):
         raise AssertionError(f"{label}: expected {expected}, got {actual}")
 
 
+@contextmanager
+def _foreign_keys_enforced():
+    """Enforce SQLite foreign keys (as PostgreSQL always does) on new connections."""
+    from sqlalchemy import event
+
+    def _enable(dbapi_conn, _record):
+        dbapi_conn.execute('PRAGMA foreign_keys=ON')
+
+    engine = db.engine
+    db.session.remove()
+    engine.dispose()
+    event.listen(engine, 'connect', _enable)
+    try:
+        yield
+    finally:
+        db.session.remove()
+        event.remove(engine, 'connect', _enable)
+        engine.dispose()
+
+
 # ---------------------------------------------------------------------------
 # Test 1 – Transaction calculations (unchanged logic)
 # ---------------------------------------------------------------------------
@@ -345,6 +366,473 @@ def test_dashboard_totals(app):
         print("  All dashboard totals checks passed.")
 
 
+# ---------------------------------------------------------------------------
+# Test 4b – Batched dashboard data matches per-fund calculations
+# ---------------------------------------------------------------------------
+
+def test_dashboard_matches_per_fund(app):
+    """
+    Verify the batched dashboard/summary path agrees with the per-fund
+    helpers across several funds and symbols.
+    """
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        svc = Services()
+
+        stocks = svc.fund_service.create_fund('Stocks', _dec(10_000))
+        crypto = svc.fund_service.create_fund('Crypto', _dec(5_000))
+        svc.fund_service.withdraw_funds(crypto.id, _dec(1_000))
+
+        rows = [
+            (stocks.id, 'Buy',  'AAPL', 100, 10, 1, datetime(2026, 1, 1)),
+            (stocks.id, 'Sell', 'AAPL', 120,  4, 1, datetime(2026, 1, 5)),
+            (stocks.id, 'Buy',  'MSFT', 200,  5, 2, datetime(2026, 1, 2)),
+            (crypto.id, 'Buy',  'BTC',  1000, 2, 5, datetime(2026, 1, 3)),
+            (crypto.id, 'Sell', 'BTC',  900,  1, 5, datetime(2026, 1, 4)),
+        ]
+        for fund_id, tx_type, symbol, price, qty, fees, date in rows:
+            t = Transaction(fund_id=fund_id, transaction_type=tx_type, symbol=symbol,
+                            price=price, quantity=qty, fees=fees, date=date)
+            t.calculate_total_cost()
+            db.session.add(t)
+        db.session.commit()
+        for fund in (stocks, crypto):
+            PortfolioCalculator.recalculate_all_averages_for_fund(fund.id)
+        db.session.commit()
+
+        print("\n" + "=" * 60)
+        print("TEST 4b – BATCHED DASHBOARD MATCHES PER-FUND HELPERS")
+        print("=" * 60)
+
+        summary, portfolio_value = PortfolioCalculator.get_category_summary()
+        totals = PortfolioCalculator.get_portfolio_dashboard_totals()
+
+        expected_value = ZERO
+        expected_pnl = ZERO
+        for cat in summary:
+            fid = cat['id']
+            cash = PortfolioCalculator.get_cash_balance_for_fund(fid)
+            invested = PortfolioCalculator.get_category_transactions_summary(fid)['current_invested']
+            realized = PortfolioCalculator.get_realized_performance_for_fund(fid)['realized_pnl']
+            _assert(f"{cat['category']} cash", cash, cat['cash'])
+            _assert(f"{cat['category']} invested", invested, cat['current_invested'])
+            _assert(f"{cat['category']} realized P&L", realized, cat['realized_pnl'])
+            _assert(f"{cat['category']} total funds",
+                    PortfolioCalculator.get_total_funds_for_fund(fid), cat['amount'])
+            expected_value += cash + invested
+            expected_pnl += realized
+
+        _assert('Portfolio value', expected_value, portfolio_value)
+        _assert('Dashboard total value', expected_value, totals['total_value'])
+        _assert('Dashboard realized P&L', expected_pnl, totals['total_realized_pnl'])
+        _assert('Dashboard total investment', 15_000, totals['total_investment'])
+
+        print("  All batched dashboard checks passed.")
+
+
+# ---------------------------------------------------------------------------
+# Test 4c – Summary cache follows transaction writes
+# ---------------------------------------------------------------------------
+
+def test_summary_cache_tracks_writes(app):
+    """
+    Verify FundSummaryCache rows are rebuilt on add/edit/delete so dashboard
+    totals stay equal to a fresh recomputation.
+    """
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        svc = Services()
+        tx = svc.transaction_service
+        fund = svc.fund_service.create_fund('Stocks', _dec(10_000))
+
+        b1 = tx.add_transaction(fund.id, 'Buy', 'AAPL', _dec(100), _dec(10), _dec(1),
+                                date=datetime(2026, 1, 1))
+        tx.add_transaction(fund.id, 'Buy', 'AAPL', _dec(110), _dec(10), _dec(1),
+                           date=datetime(2026, 1, 2))
+        s1 = tx.add_transaction(fund.id, 'Sell', 'AAPL', _dec(120), _dec(5), _dec(1),
+                                date=datetime(2026, 1, 3))
+
+        print("\n" + "=" * 60)
+        print("TEST 4c – SUMMARY CACHE FOLLOWS TRANSACTION WRITES")
+        print("=" * 60)
+
+        def _check(label):
+            totals = PortfolioCalculator.get_portfolio_dashboard_totals()
+            fresh = PortfolioCalculator._compute_fund_totals([fund.id])[fund.id]
+            _assert(f'{label}: realized P&L', fresh['realized_pnl'], totals['total_realized_pnl'])
+            _assert(f'{label}: total value',
+                    _dec(str(fund.amount)) + fresh['total_sell_cost'] - fresh['total_buy_cost']
+                    + fresh['current_invested'],
+                    totals['total_value'])
+
+        _check('after adds')
+
+        # A cache row with the right count but an older last transaction
+        # (e.g. built before a concurrent add committed) is caught too.
+        cached = FundSummaryCache.query.filter_by(fund_id=fund.id, symbol='AAPL').one()
+        cached.last_tx_id = b1.id
+        db.session.commit()
+        _check('with stale last_tx_id')
+        from portfolio_app.calculators.summary_cache import rebuild_stale_summaries
+        assert rebuild_stale_summaries(db.session) == [fund.id]
+        db.session.commit()
+        assert rebuild_stale_summaries(db.session) == []
+        print("  PASS  stale last_tx_id rebuilt")
+
+        tx.update_transaction(b1.id, price=_dec(90))
+        _check('after price edit')
+        tx.update_transaction(s1.id, symbol='MSFT')
+        _check('after symbol change')
+        tx.delete_transaction(s1.id)
+        _check('after delete')
+
+        svc.fund_service.delete_fund(fund.id)
+        assert FundSummaryCache.query.count() == 0
+
+        print("  All summary cache checks passed.")
+
+
+# ---------------------------------------------------------------------------
+# Test 4d – Schema setup runs once per database
+# ---------------------------------------------------------------------------
+
+def test_create_app_skips_initialized_schema(app):
+    """
+    Verify a second create_app() for the same database skips create_all() and
+    migrations, and that force=True runs them again.
+    """
+    import sqlalchemy as sa
+
+    print("\n" + "=" * 60)
+    print("TEST 4d – SCHEMA SETUP RUNS ONCE PER DATABASE")
+    print("=" * 60)
+
+    with app.app_context():
+        FundSummaryCache.__table__.drop(db.engine)
+
+    create_app(TestConfig)
+    with app.app_context():
+        assert not sa.inspect(db.engine).has_table('fund_summary_cache'), \
+            "repeated create_app() re-ran create_all()"
+    print("  [OK] repeated create_app() skipped schema setup")
+
+    create_app(TestConfig, force=True)
+    with app.app_context():
+        assert sa.inspect(db.engine).has_table('fund_summary_cache'), \
+            "create_app(force=True) did not recreate the table"
+    print("  [OK] force=True recreated the missing table")
+
+
+# ---------------------------------------------------------------------------
+# Test 4e – Request-scoped fund data is dropped on writes
+# ---------------------------------------------------------------------------
+
+def test_request_cache_invalidated_on_write(app):
+    """
+    Verify the per-request fund data cache is shared by repeated dashboard
+    calls but never serves totals from before a write in the same request.
+    """
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    with app.test_request_context():
+        svc = Services()
+        fund = svc.fund_service.create_fund('Stocks', _dec(1_000))
+
+        print("\n" + "=" * 60)
+        print("TEST 4e – REQUEST CACHE DROPPED ON WRITES")
+        print("=" * 60)
+
+        first = PortfolioCalculator._fetch_all_fund_data()
+        assert PortfolioCalculator._fetch_all_fund_data() is first, "fund data not reused in request"
+        print("  [OK] repeated loads share one result")
+
+        before = PortfolioCalculator.get_portfolio_dashboard_totals()
+        svc.transaction_service.add_transaction(fund.id, 'Buy', 'AAPL', _dec(100), _dec(2), _dec(0),
+                                                date=datetime(2026, 1, 1))
+        after = PortfolioCalculator.get_portfolio_dashboard_totals()
+        _assert('cash before buy', _dec(1_000), before['total_cash'])
+        _assert('cash after buy', _dec(800), after['total_cash'])
+
+
+# ---------------------------------------------------------------------------
+# Test 4f – Fund delete with foreign keys enforced
+# ---------------------------------------------------------------------------
+
+def test_fund_delete_with_foreign_keys(app):
+    """
+    Verify deleting a fund with events, transactions, a tracked asset and
+    summary cache rows works when the database enforces foreign keys.
+    """
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        with _foreign_keys_enforced():
+            assert db.session.execute(db.text('PRAGMA foreign_keys')).scalar() == 1
+
+            svc = Services()
+            fund = svc.fund_service.create_fund('Stocks', _dec(10_000))
+            svc.fund_service.deposit_funds(fund.id, _dec(500))
+            svc.transaction_service.add_transaction(fund.id, 'Buy', 'AAPL', _dec(100), _dec(10), _dec(1),
+                                                    date=datetime(2026, 1, 1))
+            svc.transaction_service.add_transaction(fund.id, 'Sell', 'AAPL', _dec(120), _dec(5), _dec(1),
+                                                    date=datetime(2026, 1, 2))
+            svc.transaction_service.add_asset(fund.id, 'MSFT')
+
+            print("\n" + "=" * 60)
+            print("TEST 4f – FUND DELETE WITH FOREIGN KEYS ENFORCED")
+            print("=" * 60)
+
+            svc.fund_service.delete_fund(fund.id)
+
+            _assert('funds left', 0, Fund.query.count())
+            _assert('events left', 0, FundEvent.query.count())
+            _assert('transactions left', 0, Transaction.query.count())
+            _assert('summary cache rows left', 0, FundSummaryCache.query.count())
+            _assert('assets left', 0, Asset.query.count())
+
+
+# ---------------------------------------------------------------------------
+# Test 4g – User delete with foreign keys enforced
+# ---------------------------------------------------------------------------
+
+def test_user_delete_with_foreign_keys(app):
+    """
+    Verify an admin can delete a user who owns funds when the database
+    enforces foreign keys; the funds are kept but no longer owned.
+    """
+    from portfolio_app.models.user import User
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        with _foreign_keys_enforced():
+            admin = User(username='admin', is_admin=True)
+            admin.set_password('adminpassword123')
+            owner = User(username='owner')
+            owner.set_password('ownerpassword123')
+            db.session.add_all([admin, owner])
+            db.session.commit()
+            admin_id, owner_id = admin.id, owner.id
+
+            fund = Services(user_id=owner_id).fund_service.create_fund('Stocks', _dec(10_000), user_id=owner_id)
+            fund_id = fund.id
+
+            print("\n" + "=" * 60)
+            print("TEST 4g – USER DELETE WITH FOREIGN KEYS ENFORCED")
+            print("=" * 60)
+
+            svc = Services(user_id=admin_id)
+            svc.auth_service.delete_user(owner_id, admin)
+
+            _assert('users left', 1, User.query.count())
+            _assert('funds left', 1, Fund.query.count())
+            assert db.session.get(Fund, fund_id).user_id is None
+            print("  PASS  fund detached from deleted user")
+
+            try:
+                svc.auth_service.delete_user(admin_id, admin)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError('admin deleted their own account')
+            _assert('admin kept', 1, User.query.count())
+
+
+# ---------------------------------------------------------------------------
+# Test 4h – Money aggregates match the Decimal walk exactly
+# ---------------------------------------------------------------------------
+
+def test_aggregates_match_decimal_walk(app):
+    """
+    Verify fund-level totals equal the per-symbol Decimal walk to the last
+    stored digit for a position large enough that float sums would drift.
+    """
+    exact = _dec('1E-12')
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        svc = Services()
+        tx = svc.transaction_service
+        fund = svc.fund_service.create_fund('Stocks', _dec('20000000000'))
+        tx.add_transaction(fund.id, 'Buy', 'BIG', _dec('98765.4321'), _dec('123456.78901234'), _dec('1.23'),
+                           date=datetime(2026, 1, 1))
+        tx.add_transaction(fund.id, 'Buy', 'BIG', _dec('0.0001'), _dec('3.3333333333'), _dec('0.01'),
+                           date=datetime(2026, 1, 2))
+
+        print("\n" + "=" * 60)
+        print("TEST 4h – MONEY AGGREGATES MATCH THE DECIMAL WALK")
+        print("=" * 60)
+
+        walk = PortfolioCalculator.get_symbol_transactions_summary(fund.id, 'BIG')
+        category = PortfolioCalculator.get_category_transactions_summary(fund.id)
+        _assert('category buy cost', walk['total_buy_cost'], category['total_buy_cost'], tol=exact)
+        _assert('category invested', walk['current_invested'], category['current_invested'], tol=exact)
+        _assert('cash balance',
+                _dec('20000000000') - walk['total_buy_cost'],
+                PortfolioCalculator.get_cash_balance_for_fund(fund.id), tol=exact)
+
+        # Quantities whose float sum lands off the last stored digit
+        for quantity in ('12345678.1234567891', '0.0000000003', '7654321.9876543219', '0.0000000004'):
+            tx.add_transaction(fund.id, 'Buy', 'QTY', _dec('0.0001'), _dec(quantity), ZERO,
+                               date=datetime(2026, 1, 3))
+        qty_walk = PortfolioCalculator.get_symbol_transactions_summary(fund.id, 'QTY')
+        _assert('quantity held for symbol', qty_walk['total_quantity_held'],
+                PortfolioCalculator.get_quantity_held_for_symbol(fund.id, 'QTY'), tol=exact)
+        _assert('quantity held for fund', walk['total_quantity_held'] + qty_walk['total_quantity_held'],
+                PortfolioCalculator.get_quantity_held_for_fund(fund.id), tol=exact)
+
+        # Dashboard totals add up the summary cache; with several large
+        # positions they must still equal the per-fund Decimal figures.
+        for day, symbol in enumerate(('P1', 'P2', 'P3', 'P4', 'P5'), start=4):
+            tx.add_transaction(fund.id, 'Buy', symbol, _dec('1234.5678901234'), _dec('987654.3210987654'),
+                               _dec('9.99'), date=datetime(2026, 1, day))
+            tx.add_transaction(fund.id, 'Sell', symbol, _dec('1300.0000000001'), _dec('123456.7890123456'),
+                               _dec('4.56'), date=datetime(2026, 1, day + 5))
+        fresh = PortfolioCalculator._compute_fund_totals([fund.id])[fund.id]
+        cash = PortfolioCalculator.get_cash_balance_for_fund(fund.id)
+        totals = PortfolioCalculator.get_portfolio_dashboard_totals()
+        _assert('dashboard cash', cash, totals['total_cash'], tol=exact)
+        _assert('dashboard realized P&L', fresh['realized_pnl'], totals['total_realized_pnl'], tol=exact)
+        _assert('dashboard total value', cash + fresh['current_invested'], totals['total_value'], tol=exact)
+        _assert('funds page cash', cash, PortfolioCalculator.get_fund_metrics()[fund.id]['cash'], tol=exact)
+
+
+# ---------------------------------------------------------------------------
+# Test 4i – Engine options follow the configured database
+# ---------------------------------------------------------------------------
+
+def test_engine_options_follow_database_uri(app):
+    """
+    Verify pool sizing is derived from the URI the app actually uses, so a
+    SQLite config never inherits server pool options.
+    """
+    from config import engine_options
+
+    class ServerConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = 'postgresql://portfolio@db.example/portfolio'
+
+    class MemoryConfig(ServerConfig):
+        SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+    class ExplicitConfig(MemoryConfig):
+        SQLALCHEMY_ENGINE_OPTIONS = {'echo': False}
+
+    print("\n" + "=" * 60)
+    print("TEST 4i – ENGINE OPTIONS FOLLOW THE DATABASE URI")
+    print("=" * 60)
+
+    server = engine_options(ServerConfig.SQLALCHEMY_DATABASE_URI)
+    assert server['pool_size'] > 0 and server['max_overflow'] >= 0
+    print("  PASS  server URI gets pool sizing")
+
+    assert create_app(MemoryConfig).config['SQLALCHEMY_ENGINE_OPTIONS'] == {}
+    print("  PASS  SQLite subclass of a server config gets no pool sizing")
+
+    assert create_app(ExplicitConfig).config['SQLALCHEMY_ENGINE_OPTIONS'] == {'echo': False}
+    print("  PASS  explicit engine options are kept")
+
+
+# ---------------------------------------------------------------------------
+# Test 4j – Fund id validation messages
+# ---------------------------------------------------------------------------
+
+def test_fund_id_form_messages(app):
+    """
+    Verify the category/fund id fields report the same message for each
+    kind of bad input: missing or non-positive, unparseable, or unknown.
+    """
+    from portfolio_app.forms import TransactionAddForm, AssetAddForm, AssetDeleteForm
+
+    print("\n" + "=" * 60)
+    print("TEST 4j – FUND ID VALIDATION MESSAGES")
+    print("=" * 60)
+
+    cases = {
+        '': 'Select a category.',
+        '0': 'Select a category.',
+        '-1': 'Select a category.',
+        '+0': 'Select a category.',
+        'abc': 'Invalid category.',
+        '1.5': 'Invalid category.',
+        '99': 'Category not found.',
+    }
+    for raw, expected in cases.items():
+        tx_form = TransactionAddForm({'fund_id': raw}, [])
+        tx_form.validate()
+        asset_form = AssetAddForm({'asset_fund_id': raw}, [])
+        asset_form.validate()
+        delete_form = AssetDeleteForm({'delete_asset_fund_id': raw})
+        delete_form.validate()
+
+        assert tx_form.errors.get('fund_id') == expected, (raw, tx_form.errors.get('fund_id'))
+        assert asset_form.errors.get('asset_fund_id') == expected, (raw, asset_form.errors.get('asset_fund_id'))
+        delete_error = delete_form.errors.get('delete_asset_fund_id')
+        assert (delete_error == 'Invalid fund ID.') == (expected != 'Category not found.'), (raw, delete_error)
+        print(f"  PASS  {raw!r}: {expected}")
+
+
+# ---------------------------------------------------------------------------
+# Test 4k – Legacy symbols are normalized at startup
+# ---------------------------------------------------------------------------
+
+def test_legacy_symbols_normalized(app):
+    """
+    Verify rows stored with lower-case or padded symbols (written before the
+    models normalized them) are upper-cased by the startup migrations, and
+    that the summary cache then covers them.
+    """
+    import sqlalchemy as sa
+
+    print("\n" + "=" * 60)
+    print("TEST 4k – LEGACY SYMBOLS NORMALIZED AT STARTUP")
+    print("=" * 60)
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        svc = Services()
+        fund = svc.fund_service.create_fund('Stocks', _dec(10_000))
+        svc.transaction_service.add_transaction(fund.id, 'Buy', 'AAPL', _dec(100), _dec(10), _dec(1),
+                                                date=datetime(2026, 1, 1))
+        svc.transaction_service.add_transaction(fund.id, 'Buy', 'AAPL', _dec(110), _dec(5), _dec(1),
+                                                date=datetime(2026, 1, 2))
+        db.session.add(Asset(fund_id=fund.id, symbol='AAPL'))
+        db.session.commit()
+
+        # Write the symbols back the way older versions stored them,
+        # bypassing the model validators.
+        db.session.execute(sa.update(Transaction.__table__).values(symbol=' aapl'))
+        db.session.execute(sa.insert(Asset.__table__).values(capital_id=fund.id, symbol='aapl '))
+        db.session.commit()
+        fund_id = fund.id
+        db.session.remove()
+
+    create_app(TestConfig, force=True)
+    with app.app_context():
+        symbols = {t.to_dict()['symbol'] for t in Transaction.query.all()}
+        assert symbols == {'AAPL'}, symbols
+        print("  PASS  transaction symbols upper-cased")
+
+        assets = [a.to_dict()['symbol'] for a in Asset.query.filter_by(fund_id=fund_id).all()]
+        assert assets == ['AAPL'], assets
+        print("  PASS  duplicate legacy asset dropped")
+
+        cached = FundSummaryCache.query.filter_by(fund_id=fund_id, symbol='AAPL').one()
+        assert cached.transaction_count == 2, cached.transaction_count
+        _assert('cached quantity held', _dec(15), cached.total_quantity_held)
+
+
 # ---------------------------------------------------------------------------
 # Test 5 – Application routes (HTTP)
 # ---------------------------------------------------------------------------
@@ -381,6 +869,77 @@ def test_routes(app):
     print("  All route checks passed.")
 
 
+# ---------------------------------------------------------------------------
+# Test 5b – Page query counts do not grow with the number of funds
+# ---------------------------------------------------------------------------
+
+def test_page_queries_independent_of_fund_count(app):
+    """
+    Verify each page issues the same number of SQL statements whether the
+    user has one fund or several (no per-fund N+1 loads).
+    """
+    from sqlalchemy import event
+    from portfolio_app.models.user import User
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        user = User(username='testuser')
+        user.set_password('testpassword123')
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    client = app.test_client()
+    client.post('/auth/login', data={'username': 'testuser', 'password': 'testpassword123'})
+
+    def _add_fund(category):
+        with app.app_context():
+            svc = Services()
+            fund = svc.fund_service.create_fund(category, _dec(10_000), user_id=user_id)
+            for day, symbol in enumerate(('AAPL', 'MSFT'), start=1):
+                svc.transaction_service.add_transaction(fund.id, 'Buy', symbol, _dec(100), _dec(2), _dec(1),
+                                                        date=datetime(2026, 1, day))
+            svc.transaction_service.add_transaction(fund.id, 'Sell', 'AAPL', _dec(110), _dec(1), _dec(1),
+                                                    date=datetime(2026, 1, 3))
+
+    statements = []
+
+    def _count_queries(path):
+        statements.clear()
+        r = client.get(path)
+        assert r.status_code == 200, f"{path} returned {r.status_code}"
+        return len(statements)
+
+    paths = ['/', '/funds/', '/transactions/', '/charts']
+
+    with app.app_context():
+        engine = db.engine
+
+    def _on_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    print("\n" + "=" * 60)
+    print("TEST 5b – PAGE QUERIES INDEPENDENT OF FUND COUNT")
+    print("=" * 60)
+
+    event.listen(engine, 'before_cursor_execute', _on_execute)
+    try:
+        _add_fund('Stocks')
+        one_fund = {path: _count_queries(path) for path in paths}
+        _add_fund('ETFs')
+        _add_fund('Crypto')
+        three_funds = {path: _count_queries(path) for path in paths}
+    finally:
+        event.remove(engine, 'before_cursor_execute', _on_execute)
+
+    for path in paths:
+        ok = one_fund[path] == three_funds[path]
+        print(f"  {'PASS' if ok else 'FAIL'}  GET {path}: {one_fund[path]} queries (1 fund), "
+              f"{three_funds[path]} queries (3 funds)")
+        assert ok, f"{path} query count grew with funds: {one_fund[path]} -> {three_funds[path]}"
+
+
 # ---------------------------------------------------------------------------
 # Runner
 # ---------------------------------------------------------------------------
@@ -399,7 +958,18 @@ if __name__ == '__main__':
         ('Fund Events Logic',          test_fund_events),
         ('Category Summary',           test_category_summary),
         ('Dashboard Totals',           test_dashboard_totals),
+        ('Batched Dashboard',          test_dashboard_matches_per_fund),
+        ('Summary Cache',              test_summary_cache_tracks_writes),
+        ('Schema Setup Once',          test_create_app_skips_initialized_schema),
+        ('Request Cache Invalidation', test_request_cache_invalidated_on_write),
+        ('Fund Delete With FKs',       test_fund_delete_with_foreign_keys),
+        ('User Delete With FKs',       test_user_delete_with_foreign_keys),
+        ('Decimal Aggregates',         test_aggregates_match_decimal_walk),
+        ('Engine Options',             test_engine_options_follow_database_uri),
+        ('Fund Id Messages',           test_fund_id_form_messages),
+        ('Legacy Symbols',             test_legacy_symbols_normalized),
         ('Application Routes',         test_routes),
+        ('Page Query Counts',          test_page_queries_independent_of_fund_count),
     ]
 
     for name, fn in tests: